@@ -13,132 +13,249 @@ Created on Sat Dec  1 00:22:07 2018
 #==============================================================================
 # Package Import
 #==============================================================================
-import os
-import pandas as pd
+import argparse
+import numpy as np
 import pathlib
+import sys
+
+# Make the shared aoc2018 helpers importable when run as a script (only 
+#   then, so that importing a solver leaves sys.path alone)
+if __name__ == '__main__':
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2018 import ingest
 
 #==============================================================================
 # Reference Variable Declaration
 #==============================================================================
+# Default puzzle input (stored alongside this script)
+PATH_INPUT = pathlib.Path(__file__).resolve().parent.joinpath('input.csv')
 
 #==============================================================================
 # Function Definitions
 #==============================================================================
-def ingest_input(file_input):
+def first_repeat_in_pass(frequencies):
     '''
-    Purpose: Ingest data given a specific filename or filepath
+    Purpose: Find the first frequency in a sequence that equals an earlier 
+        frequency of the same sequence
 
     Input: 
-        (1) file_input (string): Filename of data for part 1 challenge
+        (1) frequencies (numpy array): Frequencies in the order reached
     
     Output: 
-        (1) NONE 
+        (1) idx (int): Position of the first repeated frequency, or None if
+                every frequency is distinct
     '''
-    df = pd.read_csv(file_input)
-    
-    return df
+    # after a stable sort, every member of a run of equal frequencies other
+    #   than the first one is a repeat -- the earliest of those wins
+    order = np.argsort(frequencies, kind='stable')
+    ordered = frequencies[order]
+    is_repeat = np.zeros(len(ordered), dtype=bool)
+    is_repeat[1:] = ordered[1:] == ordered[:-1]
+    if not is_repeat.any():
+        return None
+    return int(order[is_repeat].min())
 
-def increment_frequency(current, change):
+def first_repeat(list_freq):
     '''
-    Purpose: Increment a frequency value, 'current', by the value of 'change'
+    Purpose: Find the first frequency reached twice while cycling through 
+        the frequency changes (starting from 0) without simulating the cycles
+    
+        Let f(0) = 0, f(1), ..., f(n-1) be the frequencies reached during the
+        first pass and `drift` the sum of all changes.  In pass k the same 
+        positions reach f(i) + k * drift.  If no frequency repeats during the
+        first pass, f(i) later lands on an earlier f(j) only if the two are 
+        congruent modulo the drift, after (f(j) - f(i)) / drift passes.  
+        Grouping the first-pass frequencies by residue and sorting them, the
+        nearest neighbour (in the direction of the drift) of every frequency
+        gives its earliest repeat, and the earliest of those is the answer.
+        This takes O(n log n) time, whatever the number of passes needed.
 
     Input: 
-        (1) current (int): Value of the current frequency
-        (2) change (int):  Value that the frequency shall be incremented (+/-)
+        (1) list_freq (numpy array or list of ints): Frequency changes, in 
+                order
     
     Output: 
-        (1) new (int): Value of the frequency after being incremented (+/-)
+        (1) (int): The first frequency reached twice, or None if no 
+                frequency is ever reached twice
     '''
-    new = current + change
-    return new
+    if len(list_freq) == 0:
+        return None
+    changes = np.asarray(list_freq, dtype=np.int64)
+    count = len(changes)
     
-def advance_list(idx):
+    # frequencies reached during the first pass, including the start (0)
+    frequencies = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(changes, out=frequencies[1:])
+    drift = int(frequencies[-1])
+    idx = first_repeat_in_pass(frequencies)
+    if idx is not None:
+        return int(frequencies[idx])
+    
+    # f(0)..f(n-1) are distinct and the drift is not 0 (else f(n) == f(0))
+    frequencies = frequencies[:-1]
+    residues = frequencies % abs(drift)
+    order = np.lexsort((frequencies, residues))
+    ordered = frequencies[order]
+    same_group = residues[order][1:] == residues[order][:-1]
+    if not same_group.any():
+        return None
+    
+    # for each neighbouring pair (lower, higher) of a residue group, the 
+    #   frequency that moves towards the other one in later passes starts
+    #   at position `start` and lands on the other after `passes` passes
+    lower = order[:-1][same_group]
+    higher = order[1:][same_group]
+    passes = (ordered[1:] - ordered[:-1])[same_group] // abs(drift)
+    if drift > 0:
+        start, target = lower, higher
+    else:
+        start, target = higher, lower
+    # position in the overall sequence at which each candidate repeat occurs
+    steps = passes * count + start
+    return int(frequencies[target[np.argmin(steps)]])
+
+def parse(source):
     '''
-    Purpose: Obtain the next value up in a list of integers. If we have reached
-        the end of the list, start over.
+    Purpose: Read the list of frequency changes into a compact array
 
     Input: 
-        (1) idx (int): Current position in the list
+        (1) source (string, path or file object): Filepath of the puzzle 
+                input, the text of the input itself, or an open file (e.g.
+                sys.stdin)
     
     Output: 
-        (1) new_num (int): New value by which to increment the frequency
-        (2) new_idx (int): New index position in the list (either incremented
-                by 1 or starting over at 0 if > than the length of the list)
-    '''    
-    # Check to see if we've exceeded the boundaries of the list; 
-    #   If so, start over at the beginning
-    if idx == len(list_freq):
-        idx = 0
-        
-    new_num = list_freq[idx]
-    new_idx = idx + 1
+        (1) list_freq (numpy array of int32): Frequency changes, in order 
+                (the 'change' header holds no digits and is skipped)
+    '''
+    return ingest.extract_ints(source, dtype=np.int32)
+
+def stream_frequency(source):
+    '''
+    Purpose: Apply every frequency change once, reading the changes in 
+        fixed-size chunks so that memory use does not grow with the input
+
+    Input: 
+        (1) source (string, path or file object): Filepath of the puzzle 
+                input, the text of the input itself, or an open file
     
-    return new_num, new_idx
+    Output: 
+        (1) (int): The resulting frequency
+    '''
+    return sum(int(np.sum(chunk, dtype=np.int64)) 
+               for chunk in ingest.iter_ints(source))
 
-def check_frequency_history(current, set_seen):
+def part1(list_freq):
     '''
-    Purpose: Determine if the current frequency equals a value that it has 
-        previously reached during an earlier incrementation.
+    Purpose: Starting with a value of 0, apply every frequency change once
 
     Input: 
-        (1) current (int): Value of the current frequency
-        (2) set_seen (set of ints): A record of all values that a frequency
-                has reached during the increment process
+        (1) list_freq (numpy array): Frequency changes, in order
     
     Output: 
-        (1) seen (boolean): True if the frequency has been previously achieved,
-                or False if it has not
+        (1) (int): The resulting frequency
     '''
-    if current in set_seen:
-        print('Duplicate value found!! Duplicate frequency is: ' + str(value))
-        return True, set_seen
-    else:
-        # Add the new value, 'current', to the list for future verification
-        set_seen.add(current)
-        return False, set_seen
+    return int(np.sum(list_freq, dtype=np.int64))
+
+def part2(list_freq):
+    '''
+    Purpose: Cycle through the frequency changes (starting from 0) until a 
+        frequency is reached for the second time (see `first_repeat`)
+
+    Input: 
+        (1) list_freq (numpy array): Frequency changes, in order
     
-#==============================================================================
-# Working Code
-#==============================================================================
+    Output: 
+        (1) (int): The first frequency reached twice, or None if no 
+                frequency is ever reached twice
+    '''
+    return first_repeat(list_freq)
 
-# Set the project working directory
-#path_project = pathlib.Path(__file__).resolve().parents[2]
-path_project = pathlib.Path('D:\Projects', 'adventOfCode2018')
-os.chdir(path_project)
+def solve(source):
+    '''
+    Purpose: Solve both parts of the day's challenge
 
-# Ingest the data
-df = ingest_input(path_project.joinpath('01','input.csv'))
+    Input: 
+        (1) source (string, path or file object): Filepath of the puzzle 
+                input, the text of the input itself, or an open file
+    
+    Output: 
+        (1) (tuple): Answers to part 1 and part 2
+    '''
+    list_freq = parse(source)
+    return part1(list_freq), part2(list_freq)
 
-# Convert to a list for easier iteration
-list_freq = list(df['change'])
+def expand_sources(list_inputs):
+    '''
+    Purpose: Expand the inputs named on the command line into the files to
+        be processed -- a directory stands for every file inside it, and '-'
+        for standard input
 
-#------------------------------------------------------------------------------
-# Day 1, Part 1
-#------------------------------------------------------------------------------
+    Input: 
+        (1) list_inputs (list of strings): Files, directories and/or '-'
+    
+    Output: 
+        (1) Generator of (name, source) tuples
+    '''
+    for name in list_inputs:
+        path = pathlib.Path(name)
+        if name == '-':
+            yield '<stdin>', sys.stdin
+        elif path.is_dir():
+            for path_file in sorted(path.iterdir()):
+                if path_file.is_file():
+                    yield str(path_file), path_file
+        else:
+            yield name, path
 
-# Starting with a value of 0, iterate through every frequency change
-value = 0
-for freq in list_freq:
-    # Increment the frequency
-    value = increment_frequency(value, freq)
+def solve_batch(list_inputs, stream=False):
+    '''
+    Purpose: Solve every frequency file named on the command line in one run
+
+    Input: 
+        (1) list_inputs (list of strings): Files, directories and/or '-' 
+                (see `expand_sources`)
+        (2) stream (boolean): True to compute part 1 only, in constant memory
+                (see `stream_frequency`)
+    
+    Output: 
+        (1) Generator of (name, answer1, answer2) tuples (answer2 is None 
+                when streaming)
+    '''
+    for name, source in expand_sources(list_inputs):
+        if stream:
+            yield name, stream_frequency(source), None
+        else:
+            answer1, answer2 = solve(source)
+            yield name, answer1, answer2
     
-#------------------------------------------------------------------------------
-# Day 1, Part 2
-#------------------------------------------------------------------------------
-# Starting with a value of 0, iterate through every frequency change
-status = False    # status indicator for 2nd frequency achievement
-value = 0         # starting value of frequency
-list_index = 0    # index of position in frequency list
-set_values = set()  # list for recording frequencies that have been "achieved"
-
-# Iterate over the list of frequencies until status is True
-while status != True:
-    # Obtain the value in which to increment the frequency
-    freq, list_index = advance_list(list_index)
-    # Increment the frequency
-    value = increment_frequency(value, freq)
-    # Check if the frequency has already been achieved
-    status, set_values = check_frequency_history(value, set_values)
-    # Status report
-    if list_index%100==0:
-        print(list_index)
+#==============================================================================
+# Working Code
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Day 1: Chronal Calibration')
+    parser.add_argument(
+            'inputs', nargs='*', default=[str(PATH_INPUT)],
+            help="frequency files, directories of them, or '-' for stdin")
+    parser.add_argument(
+            '--stream', action='store_true',
+            help='only compute part 1, in constant memory')
+    args = parser.parse_args()
+    
+    for name, answer1, answer2 in solve_batch(args.inputs, args.stream):
+        if len(args.inputs) > 1 or pathlib.Path(args.inputs[0]).is_dir():
+            print(name)
+        #----------------------------------------------------------------------
+        # Day 1, Part 1
+        #----------------------------------------------------------------------
+        print('The resulting frequency is: ' + str(answer1))
+        
+        #----------------------------------------------------------------------
+        # Day 1, Part 2
+        #----------------------------------------------------------------------
+        if args.stream:
+            continue
+        if answer2 is None:
+            print('No frequency is ever reached twice')
+        else:
+            print('Duplicate value found!! Duplicate frequency is: ' 
+                  + str(answer2))
@@ -47,31 +47,27 @@ Created on Sun Dec  2 20:33:02 2018
 #==============================================================================
 # Package Import
 #==============================================================================
-import os
-import pandas as pd
+import numpy as np
 import pathlib
+import sys
+
+# Make the shared aoc2018 helpers importable when run as a script (only 
+#   then, so that importing a solver leaves sys.path alone)
+if __name__ == '__main__':
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2018 import ingest
 
 #==============================================================================
 # Reference Variable Declaration
 #==============================================================================
+# Number of IDs histogrammed at a time by the batch checksum
+CHUNK_ROWS = 1 << 16
+# Default puzzle input (stored alongside this script)
+PATH_INPUT = pathlib.Path(__file__).resolve().parent.joinpath('input.csv')
 
 #==============================================================================
 # Function Definitions
 #==============================================================================
-def ingest_input(file_input):
-    '''
-    Purpose: Ingest data given a specific filename or filepath
-
-    Input: 
-        (1) file_input (string): Filename of data for part 1 challenge
-    
-    Output: 
-        (1) NONE 
-    '''
-    df = pd.read_csv(file_input)
-    
-    return df
-
 def countLetters(boxID):
     '''
     Purpose: Check if a string contains exactly two or three of any letter
@@ -90,7 +86,7 @@ def countLetters(boxID):
     count_dict = {}
     for letter in boxID:
         # if the letter exists in the dictionary, retrieve the old count and +1
-        if letter in list(count_dict):
+        if letter in count_dict:
            count = count_dict[letter]
            count_dict[letter] = count + 1
         # if the letter does not exist, add it to the dict and set count = 1
@@ -130,35 +126,104 @@ def checkSum(count_two, count_three):
 
         
 
-def checkLetterDifferences (boxID, list_boxIDs):
+def loadIDMatrix(list_boxIDs):
+    '''
+    Purpose: Load all box IDs into one fixed-width matrix of character codes
+    
+    Input:
+        (1) list_boxIDs (list): boxIDs to be loaded (ASCII strings)
+        
+    Output:
+        (1) matrix (numpy array of uint8): One row per ID, one column per 
+                position -- shorter IDs are padded with 0 (which is never a
+                valid character)
+    '''
+    width = max((len(boxID) for boxID in list_boxIDs), default=0)
+    if width == 0:
+        return np.zeros((len(list_boxIDs), 0), dtype=np.uint8)
+    # numpy pads fixed-width byte strings with NULs, which is the padding
+    fixed = np.array([boxID.encode() for boxID in list_boxIDs], 
+                     dtype='S' + str(width))
+    return fixed.view(np.uint8).reshape(len(list_boxIDs), width)
+
+def countMatchesBatch(matrix, chunk_rows=CHUNK_ROWS):
     '''
-    Purpose: Check if IDs differ by exactly one character at the same position
-        in both strings.  For example, 'fghij' and 'fguij' differ by exactly
-        one character, the third ('h' and 'u').
+    Purpose: Count the IDs containing exactly two and exactly three of any
+        letter, for all IDs at once.  Every row's letter histogram is built 
+        with a single bincount (one bin per distinct letter in the input, 
+        i.e. 26 for lower-case IDs), `chunk_rows` rows at a time to bound 
+        memory use.
     
     Input:
-        (1) boxID (string): first boxID to be compared to all other IDs
-        (2) list_boxIDs (list): list of boxIDs to compare the boxID to
+        (1) matrix (numpy array of uint8): IDs as produced by `loadIDMatrix`
+        (2) chunk_rows (int): Number of IDs histogrammed at a time
         
     Output:
-        (1) found_match (boolean): True if the number of letters different in 
-                the string is equal to 1, otherwise False
-        (2) found_match_word (string): Box ID that differs by only one letter
+        (1) count_two (int): Number of IDs containing exactly two of a letter
+        (2) count_three (int): Number of IDs containing exactly three of a 
+                letter
+    '''
+    # map every character present to a dense bin; padding goes to bin 0
+    codes = np.unique(matrix)
+    codes = codes[codes != 0]
+    num_bins = len(codes) + 1
+    lookup = np.zeros(256, dtype=np.intp)
+    lookup[codes] = np.arange(1, num_bins)
+    
+    count_two = 0
+    count_three = 0
+    for start in range(0, len(matrix), chunk_rows):
+        chunk = lookup[matrix[start:start + chunk_rows]]
+        rows = len(chunk)
+        # offset each row's bins so that one bincount covers every row
+        offsets = np.arange(rows, dtype=np.intp)[:, np.newaxis] * num_bins
+        histograms = np.bincount((chunk + offsets).ravel(), 
+                                 minlength=rows * num_bins)
+        histograms = histograms.reshape(rows, num_bins)[:, 1:]
+        count_two += int(np.any(histograms == 2, axis=1).sum())
+        count_three += int(np.any(histograms == 3, axis=1).sum())
+    return count_two, count_three
+
+def findNearDuplicates(list_boxIDs):
+    '''
+    Purpose: Find every pair of IDs that differ by exactly one character at 
+        the same position in both strings.  For example, 'fghij' and 'fguij'
+        differ by exactly one character, the third ('h' and 'u').
+        
+        Rather than comparing every ID to every other ID, each ID is indexed 
+        once per position with the character at that position masked out 
+        (e.g. 'fg_ij').  Two IDs differ only at a given position exactly when
+        they share that masked key, so the matches fall out of the index 
+        directly, in O(n * L) hash-table operations for n IDs of length L.
+    
+    Input:
+        (1) list_boxIDs (list): list of boxIDs to be compared
+        
+    Output:
+        (1) list_pairs (list of tuples): Every pair of IDs (in the order they
+                appear in `list_boxIDs`) differing by exactly one character
     '''   
-    # Iterate over every letter in the box IDs and compare the strings to see
-    #   if they match; if they don't match, increment the 'miss' counter by 1.
-    #   If the 'miss' counter exceeds 1, sto the search as these are not the
-    #   right boxes.
-    for compID in list_boxIDs:
-        count_miss = 0
-        for x, y in zip(boxID, compID):
-            if x != y:
-                count_miss += 1
-            if count_miss == 2:
-                break
-        if count_miss == 1:
-            return True, compID
-    return False, ''
+    # identical IDs differ by zero characters, so only keep the first copy
+    list_unique = list(dict.fromkeys(list_boxIDs))
+    length_max = max((len(boxID) for boxID in list_unique), default=0)
+    
+    list_pairs = []
+    # build (and discard) one index per position to bound memory use
+    for position in range(length_max):
+        dict_masked = {}
+        for boxID in list_unique:
+            if position < len(boxID):
+                masked = boxID[:position] + boxID[position + 1:]
+                dict_masked.setdefault(masked, []).append(boxID)
+        for list_group in dict_masked.values():
+            for idx, boxID in enumerate(list_group):
+                for matchingID in list_group[idx + 1:]:
+                    list_pairs.append((boxID, matchingID))
+    
+    # report the pairs in input order rather than in position order
+    dict_order = {boxID: idx for idx, boxID in enumerate(list_unique)}
+    list_pairs.sort(key=lambda pair: (dict_order[pair[0]], dict_order[pair[1]]))
+    return list_pairs
     
 def compareStrings(A, B):
     '''
@@ -178,48 +243,157 @@ def compareStrings(A, B):
 
     return matching_letters            
     
+def parse(source):
+    '''
+    Purpose: Read the list of box IDs
+
+    Input: 
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
+    
+    Output: 
+        (1) list_boxIDs (list of strings): Box IDs (the CSV's 'ID' header
+                is skipped)
+    '''
+    return [boxID for boxID in ingest.iter_lines(source, skip=1) if boxID]
+
+def countDifferences(A, B):
+    '''
+    Purpose: Determine the Hamming distance between two IDs of equal length
+        (i.e. the number of positions at which their letters differ)
+    
+    Input:
+        (1) A (string): first boxID to be compared
+        (2) B (string): second boxID to be compared
+        
+    Output:
+        (1) (int): Number of positions holding different letters
+    '''   
+    return len(A) - len(compareStrings(A, B))
+
+def splitSegments(boxID, num_segments):
+    '''
+    Purpose: Split an ID into a fixed number of contiguous segments of 
+        (nearly) equal length
+    
+    Input:
+        (1) boxID (string): ID to be split
+        (2) num_segments (int): Number of segments to produce
+        
+    Output:
+        (1) (list of strings): The segments (empty if the ID is shorter than
+                the number of segments)
+    '''   
+    length = len(boxID)
+    bounds = [(idx * length) // num_segments for idx in range(num_segments + 1)]
+    return [boxID[bounds[idx]:bounds[idx + 1]] for idx in range(num_segments)]
+
+def findSimilarIDs(list_boxIDs, max_distance=1):
+    '''
+    Purpose: Find every pair of IDs of the same length whose Hamming distance
+        is at most `max_distance` (k), streaming each pair as soon as it is 
+        found.
+        
+        Each ID is split into k+1 segments.  By the pigeonhole principle, two
+        IDs differing in at most k positions must agree on at least one whole
+        segment, so each ID only needs to be verified against the earlier IDs
+        sharing one of its segments (found through one index per segment) 
+        rather than against every other ID.
+    
+    Input:
+        (1) list_boxIDs (iterable): boxIDs to be compared (may be a generator;
+                duplicate IDs are only considered once)
+        (2) max_distance (int): Largest Hamming distance reported (k)
+        
+    Output:
+        (1) Generator of (boxID, matchingID, distance) tuples, where boxID 
+                appeared before matchingID in the input
+    '''   
+    num_segments = max_distance + 1
+    # (length, segment #, segment) --> IDs seen so far with that segment
+    dict_index = {}
+    set_seen = set()
+    for boxID in list_boxIDs:
+        if boxID in set_seen:
+            continue
+        set_seen.add(boxID)
+        list_keys = [(len(boxID), idx, segment) for idx, segment in 
+                     enumerate(splitSegments(boxID, num_segments))]
+        
+        # verify each earlier ID sharing a segment (only once, even when it
+        #   shares several segments)
+        set_candidates = set()
+        for key in list_keys:
+            for candidateID in dict_index.get(key, ()):
+                if candidateID in set_candidates:
+                    continue
+                set_candidates.add(candidateID)
+                distance = countDifferences(candidateID, boxID)
+                if distance <= max_distance:
+                    yield candidateID, boxID, distance
+        
+        for key in list_keys:
+            dict_index.setdefault(key, []).append(boxID)
+
+def part1(list_boxIDs):
+    '''
+    Purpose: Calculate the checksum of the box IDs
+
+    Input: 
+        (1) list_boxIDs (list of strings): Box IDs to be scanned
+    
+    Output: 
+        (1) checksum (int): Count of IDs containing exactly two of any letter
+                multiplied by the count of IDs containing exactly three
+    '''
+    # Calculate the count for box IDs containing exactly two or three letters
+    count_two, count_three = countMatchesBatch(loadIDMatrix(list_boxIDs))
+    return checkSum(count_two, count_three)
+
+def part2(list_boxIDs):
+    '''
+    Purpose: Find the two box IDs which differ by exactly one character at 
+        the same position and return the letters they have in common
+
+    Input: 
+        (1) list_boxIDs (list of strings): Box IDs to be compared
+    
+    Output: 
+        (1) common (string): Letters shared by the two correct box IDs (or 
+                None if no such pair exists)
+    '''
+    list_pairs = findNearDuplicates(list_boxIDs)
+    if not list_pairs:
+        return None
+    boxID, matchingID = list_pairs[0]
+    return ''.join(compareStrings(boxID, matchingID))
+
+def solve(source):
+    '''
+    Purpose: Solve both parts of the day's challenge
+
+    Input: 
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
+    
+    Output: 
+        (1) (tuple): Answers to part 1 and part 2
+    '''
+    list_boxIDs = parse(source)
+    return part1(list_boxIDs), part2(list_boxIDs)
+    
 #==============================================================================
 # Working Code
 #==============================================================================
-
-# Set the project working directory
-#path_project = pathlib.Path(__file__).resolve().parents[2]
-path_project = pathlib.Path('D:\Projects', 'adventOfCode2018')
-os.chdir(path_project)
-
-# Ingest the data
-df = ingest_input(path_project.joinpath('02','input.csv'))
-
-# Create a list out of the box IDs
-list_boxIDs = list(df['ID'])
-
-#------------------------------------------------------------------------------
-# Day 2, Part 1
-#------------------------------------------------------------------------------
-# Calculate the count for box IDs containing exactly two or three letters
-list_twos = []
-list_threes = []
-for boxID in list_boxIDs:
-    two, three = countLetters(boxID)
-    list_twos.append(two)
-    list_threes.append(three)
-    
-count_two = sum(list_twos)
-count_three = sum(list_threes)
-        
-# Calculate the checksum
-answer = checkSum(count_two, count_three)
-print('The Checksum is: ' + str(answer))
-
-#------------------------------------------------------------------------------
-# Day 2, Part 2
-#------------------------------------------------------------------------------
-# Iterate over every string in the list and compare it to all other strings
-for boxID in list_boxIDs:
-    # Test for differences between letters within an ID and all other IDs
-    test_miss, matchingID = checkLetterDifferences(boxID, list_boxIDs)
-
-    # If a difference between strings of just one letter is found, find the 
-    #   common letters between the two box IDs
-    if test_miss == True:
-        print(''.join(compareStrings(boxID, matchingID)))
+if __name__ == '__main__':
+    answer1, answer2 = solve(sys.argv[1] if len(sys.argv) > 1 else PATH_INPUT)
+    
+    #--------------------------------------------------------------------------
+    # Day 2, Part 1
+    #--------------------------------------------------------------------------
+    print('The Checksum is: ' + str(answer1))
+    
+    #--------------------------------------------------------------------------
+    # Day 2, Part 2
+    #--------------------------------------------------------------------------
+    print('The common letters are: ' + str(answer2))
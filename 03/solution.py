@@ -46,250 +46,798 @@ Created on Mon Dec 3 06:38:02 2018
 #==============================================================================
 # Package Import
 #==============================================================================
+from multiprocessing import shared_memory
 import numpy as np
-import os
-import pandas as pd
 import pathlib
+import sys
+
+# Make the shared aoc2018 helpers importable when run as a script (only 
+#   then, so that importing a solver leaves sys.path alone)
+if __name__ == '__main__':
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2018 import ingest, workers
 
 #==============================================================================
 # Reference Variable Declaration
 #==============================================================================
+# Default puzzle input (stored alongside this script)
+PATH_INPUT = pathlib.Path(__file__).resolve().parent.joinpath('input.txt')
+
+# Layout of a parsed claim (e.g. #1295 @ 312,342: 21x17 --> 1295, 312, 342, 
+#   21, 17), which matches the order of the numbers in the claim's text
+CLAIM_DTYPE = np.dtype([('id', np.int32), ('x', np.int32), ('y', np.int32), 
+                        ('w', np.int32), ('h', np.int32)])
+
+# Side (in inches) of the square tiles handed to each worker process by the
+#   tiled engine
+TILE_SIZE = 1024
 
 #==============================================================================
 # Function Definitions
 #==============================================================================
-def ingest_input(file_input):
+class Fabric:
     '''
-    Purpose: Ingest data given a specific filename or filepath
+    Live fabric that claims can be added to and withdrawn from one at a 
+    time, keeping the overlapping area and the uncontested claims up to 
+    date instead of rebuilding a fabric matrix for every change.  
+    
+    Every square inch holds the number of claims covering it and the sum of
+    their IDs (when a single claim covers a square, the sum is that claim's 
+    ID).  Adding or removing a claim only touches the squares of that claim:
+    squares going from 1 to 2 claims (or back) become (or stop being) 
+    overlap, and the claim owning them gains (or loses) a contested square.
+    The grid grows on demand, so claims can land anywhere on the fabric.
+    '''
+    def __init__(self, shape=(1000, 1000)):
+        '''
+        Input: 
+            (1) shape (tuple): Initial rows and columns of the fabric
+        '''
+        self.counts = np.zeros(shape, dtype=np.int32)
+        self.id_sums = np.zeros(shape, dtype=np.int64)
+        self.dict_claims = {}
+        self.dict_contested = {}
+        self.set_uncontested = set()
+        self.overlap = 0
+    
+    def _fit(self, rows, cols):
+        '''
+        Purpose: Grow the fabric (at least doubling it) so that it holds 
+            `rows` x `cols` squares
+        '''
+        old_rows, old_cols = self.counts.shape
+        if rows <= old_rows and cols <= old_cols:
+            return
+        shape = (max(rows, 2 * old_rows) if rows > old_rows else old_rows,
+                 max(cols, 2 * old_cols) if cols > old_cols else old_cols)
+        for name in ('counts', 'id_sums'):
+            grid = getattr(self, name)
+            grown = np.zeros(shape, dtype=grid.dtype)
+            grown[:old_rows, :old_cols] = grid
+            setattr(self, name, grown)
+    
+    def _contest(self, id_owners, delta):
+        '''
+        Purpose: Change the number of contested squares of the claims owning
+            squares that just gained / lost a second claim
+        '''
+        owners, num_squares = np.unique(id_owners, return_counts=True)
+        for owner, num in zip(owners.tolist(), num_squares.tolist()):
+            self.dict_contested[owner] += delta * num
+            if self.dict_contested[owner]:
+                self.set_uncontested.discard(owner)
+            else:
+                self.set_uncontested.add(owner)
+    
+    def add_claim(self, claim_id, x, y, w, h):
+        '''
+        Purpose: Lay a claim on the fabric
+
+        Input: 
+            (1) claim_id (int): ID of the claim (unique on the fabric)
+            (2) x, y, w, h (int): Left edge, top edge, width and height of 
+                    the claim
+        
+        Output: 
+            (1) NONE
+        '''
+        if claim_id in self.dict_claims:
+            raise ValueError('Claim #' + str(claim_id) + ' is already on '
+                             'the fabric')
+        self._fit(y + h, x + w)
+        counts = self.counts[y:y+h, x:x+w]
+        id_sums = self.id_sums[y:y+h, x:x+w]
+        
+        # squares claimed once so far now become overlap and contested for 
+        #   their owner, while the new claim is contested on every square
+        #   that was already claimed
+        shared = counts == 1
+        self.dict_claims[claim_id] = (x, y, w, h)
+        self.dict_contested[claim_id] = int(np.count_nonzero(counts))
+        if not self.dict_contested[claim_id]:
+            self.set_uncontested.add(claim_id)
+        self._contest(id_sums[shared], 1)
+        self.overlap += int(np.count_nonzero(shared))
+        counts += 1
+        id_sums += claim_id
+    
+    def remove_claim(self, claim_id):
+        '''
+        Purpose: Withdraw a claim from the fabric
+
+        Input: 
+            (1) claim_id (int): ID of a claim on the fabric
+        
+        Output: 
+            (1) NONE
+        '''
+        x, y, w, h = self.dict_claims.pop(claim_id)
+        del self.dict_contested[claim_id]
+        self.set_uncontested.discard(claim_id)
+        counts = self.counts[y:y+h, x:x+w]
+        id_sums = self.id_sums[y:y+h, x:x+w]
+        counts -= 1
+        id_sums -= claim_id
+        
+        # squares left with a single claim stop being overlap, and stop 
+        #   being contested for the claim remaining on them
+        alone = counts == 1
+        self._contest(id_sums[alone], -1)
+        self.overlap -= int(np.count_nonzero(alone))
+    
+    def overlap_area(self):
+        '''
+        Purpose: Square inches of fabric currently within two or more claims
+        '''
+        return self.overlap
+    
+    def uncontested_claims(self):
+        '''
+        Purpose: IDs of the claims currently not overlapping any other claim
+            (sorted)
+        '''
+        return sorted(self.set_uncontested)
+
+def parse(source):
+    '''
+    Purpose: Parse every fabric claim, in a single bulk pass over the input,
+        into a structured array that all later stages work from
 
     Input: 
-        (1) file_input (string): Filename of data for part 1 challenge
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
     
     Output: 
-        (1) NONE 
+        (1) claims (numpy array of CLAIM_DTYPE): One record (id, x, y, w, h)
+                per claim (e.g. #1295 @ 312,342: 21x17 --> 1295, 312, 342, 
+                21, 17)
+    '''
+    numbers = ingest.extract_ints(source, signed=False, dtype=np.int32)
+    if len(numbers) % len(CLAIM_DTYPE.names):
+        raise ValueError('Every claim must hold exactly five numbers '
+                         '(#id @ x,y: wxh)')
+    return numbers.view(CLAIM_DTYPE)
+
+def evaluate_grid(claims):
     '''
-    with open(file_input, 'r') as f:
-        content = f.readlines()
+    Purpose: Evaluate all claims by laying them on a live Fabric one at a 
+        time (kept as a reference for the faster engines)
+
+    Input: 
+        (1) claims (numpy array of CLAIM_DTYPE): Parsed fabric claims
     
-    return content
+    Output: 
+        (1) overlap (int): Square inches of fabric claimed by multiple claims
+        (2) list_intact (list of ints): IDs of the claims that don't overlap
+                any other claim
+    '''
+    fabric = Fabric()
+    for claim in claims.tolist():
+        fabric.add_claim(*claim)
+    set_intact = set(fabric.uncontested_claims())
+    list_intact = [claim_id for claim_id in claims['id'].tolist() 
+                   if claim_id in set_intact]
+    return fabric.overlap_area(), list_intact
 
-def make_fabric_grid():
+def count_dtype(num_claims):
     '''
-    Purpose: Create a fabric grid that is slightly bigger than the estimated
-        gride size of 1000 x 1000 (default to 1200 x 1200) just to on the safe
-        side.  This grid represents the fabric structure used in this problem.
+    Purpose: Choose the smallest signed integer type able to count claims
 
     Input: 
-        (1) NONE
+        (1) num_claims (int): Number of claims (i.e. the largest count)
     
     Output: 
-        (1) fabric_matrix (numpy matrix [i.e. 2-D array] of size 1200 x 1200)
-                - default value for each cell is 0
+        (1) (numpy dtype): int8, int16, int32 or int64
     '''
-    # default to 1200 x 1200 gride
-    fabric_matrix = np.zeros((1200,1200))
-    return fabric_matrix
+    # a signed type reaching -(n + 1) also reaches +n (e.g. int8 stops at 
+    #   +127 for -128)
+    return np.min_scalar_type(-(max(num_claims, 0) + 1))
 
-def make_claims(claim):
+def claim_coverage(x, y, w, h, shape):
     '''
-    Purpose: For a given claim, identify the claim's X/Y coordinates and for
-        every cell which the claim is 'claiming', increment the associated cell 
-        count by 1.  For example, an X/Y coordinate having a value of 4 would 
-        mean that 4 claims have been made for that cell.
+    Purpose: Count how many claims cover every cell of the fabric.  Rather 
+        than marking every cell of every claim, each claim adds +1/-1 at the
+        four corners of a difference array (O(1) work per claim), and two 
+        cumulative sums then recover the counts.
 
     Input: 
-        (1) claim (string): Fabric claim containing the claim's ID #, the 
-                starting X/Y coordinates and the number of inches wide and high
-                that the claim is being made for
-                (e.g. #1295 @ 312,342: 21x17 ---- Claim number 1295 starting at
-                 312 inches in from the lef (x) and 342 inches from the top (Y)
-                 21 inches in width (x) and 17 inches in height(y))
+        (1) x, y, w, h (numpy arrays): Left edge, top edge, width and height
+                of every claim
+        (2) shape (tuple): Rows and columns of the fabric to be counted 
+                (every claim must fit inside it)
     
     Output: 
-        (1) fabric_matrix (numpy matrix [i.e. 2-D array] of size 1200 x 1200)
-                - cell values have been updated to reflect the correct # of
-                    claims for each cell
-    '''
-    # obtain basic information about the claim from the string
-    claim_start_x = int(claim.split('@ ')[1].split(',')[0])
-    claim_start_y = int(claim.split('@ ')[1].split(',')[1].split(':')[0])
-    claim_len_x = int(claim.split('x')[0].split(': ')[1])
-    claim_len_y = int(claim.split('x')[1].strip())
-    
-    # introduce offset to account for real counting vs python counting
-    claim_start_x = claim_start_x + 1
-    claim_start_y = claim_start_y + 1
-    
-    # make claim by starting at the starting point and incrementing the claim
-    #   count for a given cell by 1
-    # for every row
-    y = claim_start_y
-    while y < (claim_start_y + claim_len_y):
-        # for every column
-        x = claim_start_x
-        while x < (claim_start_x + claim_len_x):
-            # increment the [x][y] coordinate's 'claim count'
-            try:
-                fabric_matrix[x][y] += 1
-            except:
-                print('x is: ' + str(x) + ', y is: ' + str(y))
-                print('current value is: ' + str(fabric_matrix[x][y]))
-            x += 1  # move to the next cell in the row
-        y += 1      # move up a row in the column
-    return fabric_matrix    
-
-def make_claims_with_ids(claim):
-    '''
-    Purpose: For a given claim, identify the claim's X/Y coordinates and for
-        every cell which the claim is 'claiming', set the value of the cell
-        to equal the claim's ID.  If a claim already exists for that cell,
-        set the cell's value to 99 so that we know multiple claims are being
-        made.  
+        (1) coverage (numpy array): Number of claims covering each cell, 
+                indexed [y, x], in the smallest suitable integer type
+    '''
+    dtype = count_dtype(len(x))
+    diff = np.zeros((shape[0] + 1, shape[1] + 1), dtype=dtype)
+    np.add.at(diff, (y, x), 1)
+    np.add.at(diff, (y, x + w), -1)
+    np.add.at(diff, (y + h, x), -1)
+    np.add.at(diff, (y + h, x + w), 1)
+    np.cumsum(diff, axis=0, dtype=dtype, out=diff)
+    np.cumsum(diff, axis=1, dtype=dtype, out=diff)
+    return diff[:-1, :-1]
+
+def rectangle_sums(table, x, y, w, h):
+    '''
+    Purpose: Sum a grid over many rectangles at once using its summed-area 
+        table
 
     Input: 
-        (1) claim (string): Fabric claim containing the claim's ID #, the 
-                starting X/Y coordinates and the number of inches wide and high
-                that the claim is being made for
-                (e.g. #1295 @ 312,342: 21x17 ---- Claim number 1295 starting at
-                 312 inches in from the lef (x) and 342 inches from the top (Y)
-                 21 inches in width (x) and 17 inches in height(y))
+        (1) table (numpy array): Summed-area table, where table[r, c] holds 
+                the sum of grid[:r, :c]
+        (2) x, y, w, h (numpy arrays): The rectangles
     
     Output: 
-        (1) fabric_matrix (numpy matrix [i.e. 2-D array] of size 1200 x 1200)
-                - cell values have been updated to reflect the ID's of the
-                    claims "claiming" each cell -- value == 99 if multiple
-                    claims exist
-    '''
-    # obtain basic information about the claim from the string
-    claim_id = int(claim.split(' @')[0].split('#')[1])
-    claim_start_x = int(claim.split('@ ')[1].split(',')[0])
-    claim_start_y = int(claim.split('@ ')[1].split(',')[1].split(':')[0])
-    claim_len_x = int(claim.split('x')[0].split(': ')[1])
-    claim_len_y = int(claim.split('x')[1].strip())
-    
-    # introduce offset to account for real counting vs python counting
-    claim_start_x = claim_start_x + 1
-    claim_start_y = claim_start_y + 1
-    
-    # make claim by starting at the starting point and inserting the ID of the
-    #   claim into an associated cell -- if a claim has already been made 
-    #   (i.e. the cell value does not equal 0) set the value to 99 so that it
-    #    is known the cell has already been claimed
-    # for every row
-    y = claim_start_y
-    while y < (claim_start_y + claim_len_y):
-        # for every column
-        x = claim_start_x
-        while x < (claim_start_x + claim_len_x):
-            # if the cell has already been claimed, set the value to 99
-            if fabric_matrix[x][y] != 0:
-                fabric_matrix[x][y] = 99
-            # if the cell has not been claimed, set the value to the claim ID
-            else:
-                fabric_matrix[x][y] = claim_id
-            x += 1  # move to the next cell in the row
-        y += 1      # move up a row in the column     
-    return fabric_matrix    
+        (1) (numpy array): Sum of the grid over every rectangle
+    '''
+    return (table[y + h, x + w] - table[y, x + w] 
+            - table[y + h, x] + table[y, x])
 
-def validate_claims(claim, matrix):
+def evaluate_diff(claims):
     '''
-    Purpose: For a given claim, identify the claim's X/Y coordinates and for
-        every cell which the claim is 'claiming', determine if the cell has 
-        been claimed by another cell (i.e. the cell's value equals 1 and not 
-        99).  If the process of iterating through every cell is completed and
-        a 99 has not been found, all the claim's 'claims' are valid and the
-        claim ID number will be output to the screen.
+    Purpose: Evaluate all claims with a difference array sized to the claims'
+        bounding box, without any per-cell Python work
 
     Input: 
-        (1) claim (string): Fabric claim containing the claim's ID #, the 
-                starting X/Y coordinates and the number of inches wide and high
-                that the claim is being made for
-                (e.g. #1295 @ 312,342: 21x17 ---- Claim number 1295 starting at
-                 312 inches in from the lef (x) and 342 inches from the top (Y)
-                 21 inches in width (x) and 17 inches in height(y))
-        (2) matrix (numpy matrix [i.e. 2-D array] of size 1200 x 1200)
-                - cell values contain the ID's of the claims 'claiming' each
-                    cell --> a value of 99 means that cell has been 'claimed'
-                    by multiple claims
+        (1) claims (numpy array of CLAIM_DTYPE): Parsed fabric claims
     
     Output: 
-        (1) NONE
-    '''
-
-    # obtain basic information about the claim from the string
-    claim_id = int(claim.split(' @')[0].split('#')[1])
-    claim_start_x = int(claim.split('@ ')[1].split(',')[0])
-    claim_start_y = int(claim.split('@ ')[1].split(',')[1].split(':')[0])
-    claim_len_x = int(claim.split('x')[0].split(': ')[1])
-    claim_len_y = int(claim.split('x')[1].strip())
-    
-    # introduce offset to account for real counting vs python counting
-    claim_start_x = claim_start_x + 1
-    claim_start_y = claim_start_y + 1    
-            
-    # iterate through every cell a claim is making and determine if the claim
-    #   has been made by multiple cell (i.e. cell == 99)
-    y = claim_start_y
-    while y < (claim_start_y + claim_len_y):
-        # for every column
-        x = claim_start_x
-        while x < (claim_start_x + claim_len_x):
-            # insert into correct [x][y] coordinate
-            if fabric_matrix[x][y] == 99:
-                return
-            x += 1  # move to the next cell in the row
-        y += 1      # move up a row in the column     
-    
-    print('Valid claim found: ' + str(claim_id))
-    return
+        (1) overlap (int): Square inches of fabric claimed by multiple claims
+        (2) list_intact (list of ints): IDs of the claims that don't overlap
+                any other claim
+    '''
+    if len(claims) == 0:
+        return 0, []
+    claim_id, x, y, w, h = (claims[name] for name in CLAIM_DTYPE.names)
+    # the grid only spans the claims' bounding box
+    x, y = x - x.min(), y - y.min()
+    shape = (int((y + h).max()), int((x + w).max()))
+    contested = claim_coverage(x, y, w, h, shape) >= 2
     
-#==============================================================================
-# Working Code
-#==============================================================================
+    # summed-area table of the contested cells: its total is the overlap and
+    #   a claim is intact when its rectangle holds no contested cell
+    table_dtype = np.int32 if contested.size < 2**31 else np.int64
+    table = np.zeros((shape[0] + 1, shape[1] + 1), dtype=table_dtype)
+    np.cumsum(contested, axis=0, dtype=table_dtype, out=table[1:, 1:])
+    np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+    intact = rectangle_sums(table, x, y, w, h) == 0
+    return int(table[-1, -1]), claim_id[intact].tolist()
 
-# Set the project working directory
-#path_project = pathlib.Path(__file__).resolve().parents[2]
-path_project = pathlib.Path('/home/ejreidelbach/Projects/adventOfCode2018')
-os.chdir(path_project)
+class CoverageTree:
+    '''
+    Segment tree over the elementary y-intervals of a sweep line.  Every node
+    keeps the number of claims covering its whole interval (`cover`, never 
+    pushed down), the length of its interval covered at least once / at 
+    least twice, and the largest coverage count found inside it.
+    '''
+    def __init__(self, ys):
+        '''
+        Input: 
+            (1) ys (list of ints): Sorted, distinct y coordinates bounding 
+                    the elementary intervals
+        '''
+        self.ys = ys
+        self.size = len(ys) - 1
+        self.cover = [0] * (4 * max(self.size, 1))
+        self.len1 = [0] * (4 * max(self.size, 1))
+        self.len2 = [0] * (4 * max(self.size, 1))
+        self.most = [0] * (4 * max(self.size, 1))
+        
+    def update(self, lo, hi, delta, node=1, left=0, right=None):
+        '''
+        Purpose: Add `delta` claims to the elementary intervals [lo, hi)
+        '''
+        if right is None:
+            right = self.size
+        if hi <= left or right <= lo:
+            return
+        if lo <= left and right <= hi:
+            self.cover[node] += delta
+        else:
+            middle = (left + right) // 2
+            self.update(lo, hi, delta, 2 * node, left, middle)
+            self.update(lo, hi, delta, 2 * node + 1, middle, right)
+        self._pull(node, left, right)
+    
+    def _pull(self, node, left, right):
+        '''
+        Purpose: Recompute a node's lengths and maximum from its own count 
+            and its children
+        '''
+        full = self.ys[right] - self.ys[left]
+        count = self.cover[node]
+        if right - left == 1:
+            self.len1[node] = full if count >= 1 else 0
+            self.len2[node] = full if count >= 2 else 0
+            self.most[node] = count
+            return
+        one = self.len1[2 * node] + self.len1[2 * node + 1]
+        two = self.len2[2 * node] + self.len2[2 * node + 1]
+        self.len1[node] = full if count >= 1 else one
+        self.len2[node] = full if count >= 2 else (one if count == 1 else two)
+        self.most[node] = count + max(self.most[2 * node], 
+                                      self.most[2 * node + 1])
+    
+    def query_max(self, lo, hi, node=1, left=0, right=None):
+        '''
+        Purpose: Largest coverage count over the elementary intervals 
+            [lo, hi) (-1 if the range is empty)
+        '''
+        if right is None:
+            right = self.size
+        if hi <= left or right <= lo:
+            return -1
+        if lo <= left and right <= hi:
+            return self.most[node]
+        middle = (left + right) // 2
+        return self.cover[node] + max(
+                self.query_max(lo, hi, 2 * node, left, middle),
+                self.query_max(lo, hi, 2 * node + 1, middle, right))
 
-# Ingest the data
-list_claims = ingest_input(path_project.joinpath('03','input.txt'))
+class StampTree:
+    '''
+    Segment tree over the elementary y-intervals of a sweep line recording, 
+    for every interval, the latest "stamp" (insertion number) of a claim 
+    that covered it.  Stamps are kept on the nodes they fully cover and are
+    never pushed down.
+    '''
+    def __init__(self, size):
+        '''
+        Input: 
+            (1) size (int): Number of elementary intervals
+        '''
+        self.size = size
+        self.tag = [-1] * (4 * max(size, 1))
+        self.best = [-1] * (4 * max(size, 1))
+    
+    def stamp(self, lo, hi, value, node=1, left=0, right=None):
+        '''
+        Purpose: Record `value` over the elementary intervals [lo, hi)
+        '''
+        if right is None:
+            right = self.size
+        if hi <= left or right <= lo:
+            return
+        if lo <= left and right <= hi:
+            self.tag[node] = max(self.tag[node], value)
+            self.best[node] = max(self.best[node], value)
+            return
+        middle = (left + right) // 2
+        self.stamp(lo, hi, value, 2 * node, left, middle)
+        self.stamp(lo, hi, value, 2 * node + 1, middle, right)
+        self.best[node] = max(self.tag[node], self.best[2 * node], 
+                              self.best[2 * node + 1])
+    
+    def query(self, lo, hi, node=1, left=0, right=None):
+        '''
+        Purpose: Latest stamp recorded anywhere over the elementary intervals 
+            [lo, hi) (-1 if none)
+        '''
+        if right is None:
+            right = self.size
+        if hi <= left or right <= lo:
+            return -1
+        if lo <= left and right <= hi:
+            return self.best[node]
+        middle = (left + right) // 2
+        return max(self.tag[node],
+                   self.query(lo, hi, 2 * node, left, middle),
+                   self.query(lo, hi, 2 * node + 1, middle, right))
 
-#------------------------------------------------------------------------------
-# Day 3, Part 1
-#------------------------------------------------------------------------------
-# How many square inches of fabric are within two or more claims?
+def evaluate_sweep(claims):
+    '''
+    Purpose: Evaluate all claims with a sweep line over x, for fabrics far 
+        too large to hold as a grid (memory is proportional to the number 
+        of claims, not to the area of the fabric).
+        
+        Every claim opens at its left edge and closes at its right edge. 
+        Between two consecutive edges, the length of y covered by two or 
+        more open claims (from a CoverageTree) times the distance swept is 
+        contested area.  A claim overlaps another if, when it opens, some 
+        open claim already covers part of its y-range, or if, when it 
+        closes, a claim opened after it has stamped part of its y-range 
+        (that claim was then open at the same time).
 
-# Initialize a fabric matrix
-fabric_matrix = make_fabric_grid()
+    Input: 
+        (1) claims (numpy array of CLAIM_DTYPE): Parsed fabric claims
+    
+    Output: 
+        (1) overlap (int): Square inches of fabric claimed by multiple claims
+        (2) list_intact (list of ints): IDs of the claims that don't overlap
+                any other claim
+    '''
+    # claims without any area can neither overlap nor be overlapped
+    list_idx = [idx for idx in range(len(claims)) 
+                if claims['w'][idx] > 0 and claims['h'][idx] > 0]
+    x1 = claims['x'].tolist()
+    y1 = claims['y'].tolist()
+    x2 = (claims['x'] + claims['w']).tolist()
+    y2 = (claims['y'] + claims['h']).tolist()
+    
+    # compress y: claims are described by their elementary intervals
+    ys = sorted(set(y1[idx] for idx in list_idx) 
+                | set(y2[idx] for idx in list_idx))
+    dict_rank = {y: rank for rank, y in enumerate(ys)}
+    coverage = CoverageTree(ys)
+    stamps = StampTree(len(ys) - 1)
+    
+    # closing edges sort before opening edges at the same x (edges touching
+    #   is not an overlap)
+    list_events = sorted([(x1[idx], 1, idx) for idx in list_idx] 
+                         + [(x2[idx], 0, idx) for idx in list_idx])
+    contested = [False] * len(claims)
+    dict_stamp = {}
+    overlap = 0
+    x_previous = None
+    for x, is_open, idx in list_events:
+        if x_previous is not None:
+            overlap += coverage.len2[1] * (x - x_previous)
+        x_previous = x
+        lo, hi = dict_rank[y1[idx]], dict_rank[y2[idx]]
+        if is_open:
+            if coverage.query_max(lo, hi) > 0:
+                contested[idx] = True
+            dict_stamp[idx] = len(dict_stamp)
+            stamps.stamp(lo, hi, dict_stamp[idx])
+            coverage.update(lo, hi, 1)
+        else:
+            if stamps.query(lo, hi) > dict_stamp[idx]:
+                contested[idx] = True
+            coverage.update(lo, hi, -1)
+    
+    list_intact = [int(claims['id'][idx]) for idx in range(len(claims)) 
+                   if not contested[idx]]
+    return overlap, list_intact
 
-# for every claim, cycle over it and start adding claims to the grid
-for claim in list_claims:
-    fabric_matrix = make_claims(claim)
+class ClaimIndex:
+    '''
+    Bucketed grid index over the claims, answering "which claims cover this 
+    square / intersect this rectangle / overlap each other" without building
+    a fabric matrix.  The fabric is cut into square buckets about the size 
+    of a typical claim and every claim is filed under each bucket it touches,
+    so a query only inspects the handful of claims sharing its buckets.
+    '''
+    def __init__(self, claims, bucket_size=None):
+        '''
+        Input: 
+            (1) claims (numpy array of CLAIM_DTYPE): Parsed fabric claims
+            (2) bucket_size (int): Side of a bucket in inches (defaults to
+                    the median side of the claims)
+        '''
+        self.ids = claims['id'].tolist()
+        self.x1 = claims['x'].tolist()
+        self.y1 = claims['y'].tolist()
+        self.x2 = (claims['x'] + claims['w']).tolist()
+        self.y2 = (claims['y'] + claims['h']).tolist()
+        if bucket_size is None:
+            sides = np.maximum(claims['w'], claims['h'])
+            bucket_size = int(np.median(sides)) if len(sides) else 1
+        self.bucket_size = max(bucket_size, 1)
+        
+        # claims without any area cover no square and are never filed
+        self.buckets = {}
+        for idx in range(len(self.ids)):
+            if self.x2[idx] > self.x1[idx] and self.y2[idx] > self.y1[idx]:
+                for key in self._keys(self.x1[idx], self.y1[idx], 
+                                      self.x2[idx], self.y2[idx]):
+                    self.buckets.setdefault(key, []).append(idx)
+    
+    def _keys(self, x1, y1, x2, y2):
+        '''
+        Purpose: Buckets touched by the (non-empty) rectangle [x1, x2) x 
+            [y1, y2)
+        '''
+        size = self.bucket_size
+        for bx in range(x1 // size, (x2 - 1) // size + 1):
+            for by in range(y1 // size, (y2 - 1) // size + 1):
+                yield bx, by
+    
+    def _intersects(self, idx, x1, y1, x2, y2):
+        '''
+        Purpose: Check if claim `idx` shares at least one square with the 
+            rectangle [x1, x2) x [y1, y2)
+        '''
+        return (self.x1[idx] < x2 and x1 < self.x2[idx] 
+                and self.y1[idx] < y2 and y1 < self.y2[idx])
+    
+    def claims_at(self, x, y):
+        '''
+        Purpose: Find the claims covering the square inch at (x, y)
 
-# We're interested in determining the number of cells with multiple claims
-# Begin by subtracting out any cells claimed by only one claim 
-#   --> set value = 0  
-fabric_matrix[fabric_matrix == 1] = 0
-# Set all cells claimed by mupltiple claims to 1
-fabric_matrix[fabric_matrix >= 2] = 1
+        Input: 
+            (1) x, y (int): Inches from the left / top edge of the fabric
+        
+        Output: 
+            (1) (list of ints): IDs of the claims covering the square
+        '''
+        key = (x // self.bucket_size, y // self.bucket_size)
+        return [self.ids[idx] for idx in self.buckets.get(key, []) 
+                if self._intersects(idx, x, y, x + 1, y + 1)]
+    
+    def claims_in(self, x, y, w, h):
+        '''
+        Purpose: Find the claims sharing at least one square inch with a 
+            rectangle
 
-# Add together the value of all cells (i.e. all 1's) to determine the total 
-#   inches of fabric claimed by multiple claims
-np.sum(fabric_matrix)
+        Input: 
+            (1) x, y, w, h (int): Left edge, top edge, width and height of 
+                    the rectangle
+        
+        Output: 
+            (1) (list of ints): IDs of the intersecting claims, in the order
+                    the claims were given
+        '''
+        if w <= 0 or h <= 0:
+            return []
+        set_found = set()
+        for key in self._keys(x, y, x + w, y + h):
+            for idx in self.buckets.get(key, []):
+                if self._intersects(idx, x, y, x + w, y + h):
+                    set_found.add(idx)
+        return [self.ids[idx] for idx in sorted(set_found)]
+    
+    def overlapping_pairs(self):
+        '''
+        Purpose: Find every pair of claims sharing at least one square inch.
+            Two claims share several buckets when they overlap across a 
+            bucket edge, so a pair is only reported from the bucket holding 
+            the top-left square of their intersection.
 
-#------------------------------------------------------------------------------
-# Day 3, Part 2
-#------------------------------------------------------------------------------
+        Input: 
+            (1) NONE
+        
+        Output: 
+            (1) (generator of tuples): (ID, ID) of every overlapping pair
+        '''
+        size = self.bucket_size
+        for (bx, by), list_idx in self.buckets.items():
+            for position, idx_a in enumerate(list_idx):
+                for idx_b in list_idx[position + 1:]:
+                    if not self._intersects(idx_b, self.x1[idx_a], 
+                                            self.y1[idx_a], self.x2[idx_a], 
+                                            self.y2[idx_a]):
+                        continue
+                    corner_x = max(self.x1[idx_a], self.x1[idx_b])
+                    corner_y = max(self.y1[idx_a], self.y1[idx_b])
+                    if (corner_x // size, corner_y // size) == (bx, by):
+                        yield self.ids[idx_a], self.ids[idx_b]
+    
+    def intact_claims(self):
+        '''
+        Purpose: Find the claims that don't overlap any other claim
+
+        Input: 
+            (1) NONE
+        
+        Output: 
+            (1) list_intact (list of ints): IDs of the intact claims, in the 
+                    order the claims were given
+        '''
+        set_contested = set()
+        for id_a, id_b in self.overlapping_pairs():
+            set_contested.update((id_a, id_b))
+        return [claim_id for claim_id in self.ids 
+                if claim_id not in set_contested]
+
+def bucket_by_tile(claims, tile_size):
+    '''
+    Purpose: Assign every claim to each of the tiles its rectangle touches
+
+    Input: 
+        (1) claims (numpy array of CLAIM_DTYPE): Parsed fabric claims
+        (2) tile_size (int): Side of a tile in inches
+    
+    Output: 
+        (1) dict_tiles (dictionary): Indices (numpy array) of the claims 
+                touching each tile, keyed by the tile's (row, column)
+    '''
+    # claims without any area touch no tile
+    idx = np.flatnonzero((claims['w'] > 0) & (claims['h'] > 0))
+    x, y = claims['x'][idx], claims['y'][idx]
+    first_col, first_row = x // tile_size, y // tile_size
+    last_col = (x + claims['w'][idx] - 1) // tile_size
+    last_row = (y + claims['h'][idx] - 1) // tile_size
+    
+    # claims span few tiles, so walk the spans one offset at a time
+    list_idx, list_rows, list_cols = [], [], []
+    for d_row in range(int((last_row - first_row).max(initial=-1)) + 1):
+        for d_col in range(int((last_col - first_col).max(initial=-1)) + 1):
+            mask = ((first_row + d_row <= last_row) 
+                    & (first_col + d_col <= last_col))
+            list_idx.append(idx[mask])
+            list_rows.append(first_row[mask] + d_row)
+            list_cols.append(first_col[mask] + d_col)
+    if not list_idx:
+        return {}
+    idx, rows, cols = (np.concatenate(list_idx), np.concatenate(list_rows),
+                       np.concatenate(list_cols))
+    order = np.lexsort((idx, cols, rows))
+    idx, rows, cols = idx[order], rows[order], cols[order]
+    starts = np.flatnonzero(np.r_[True, (np.diff(rows) != 0) 
+                                        | (np.diff(cols) != 0)])
+    return {(int(rows[start]), int(cols[start])): chunk 
+            for start, chunk in zip(starts, np.split(idx, starts[1:]))}
 
-# Re-Initialize a fabric matrix
-fabric_matrix = make_fabric_grid()
+def evaluate_tile(task):
+    '''
+    Purpose: Mark the claims touching one tile of the fabric (run in a 
+        worker process of evaluate_tiled).  Claims are read from shared 
+        memory, clipped to the tile and counted with claim_coverage, then the
+        tile's overlap and the claims holding a contested square inside it 
+        are reported back.
+
+    Input: 
+        (1) task (tuple): Name of the shared claims block, the number of 
+                claims, the tile's bounds (top, bottom, left, right) and the
+                indices of the claims touching the tile
+    
+    Output: 
+        (1) overlap (int): Contested squares inside the tile
+        (2) contested (numpy array): Indices of the claims holding at least 
+                one contested square inside the tile
+    '''
+    name_claims, num_claims, (top, bottom, left, right), idx = task
+    block_claims = shared_memory.SharedMemory(name=name_claims)
+    try:
+        claims = np.ndarray(num_claims, dtype=CLAIM_DTYPE, 
+                            buffer=block_claims.buf)[idx]
+    finally:
+        block_claims.close()
+    
+    # clip the claims to the tile, relative to its top-left corner
+    x = np.maximum(claims['x'], left) - left
+    y = np.maximum(claims['y'], top) - top
+    w = np.minimum(claims['x'] + claims['w'], right) - left - x
+    h = np.minimum(claims['y'] + claims['h'], bottom) - top - y
+    coverage = claim_coverage(x, y, w, h, (bottom - top, right - left))
+    
+    table = np.zeros((bottom - top + 1, right - left + 1), dtype=np.int64)
+    np.cumsum(coverage >= 2, axis=0, out=table[1:, 1:])
+    np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+    contested = idx[rectangle_sums(table, x, y, w, h) > 0]
+    return int(table[-1, -1]), contested
+
+def evaluate_tiled(claims, tile_size=TILE_SIZE, processes=None):
+    '''
+    Purpose: Evaluate all claims on a fabric split into square tiles that a
+        pool of worker processes count in parallel.  The claims are placed 
+        in shared memory once and each tile only reads the claims touching 
+        it; no worker holds more than a tile of the fabric.  The overlap of 
+        every tile is summed and a claim is intact when no tile reports it 
+        as contested.
+
+    Input: 
+        (1) claims (numpy array of CLAIM_DTYPE): Parsed fabric claims
+        (2) tile_size (int): Side of a tile in inches
+        (3) processes (int): Number of worker processes (defaults to the
+                number of CPUs)
+    
+    Output: 
+        (1) overlap (int): Square inches of fabric claimed by multiple claims
+        (2) list_intact (list of ints): IDs of the claims that don't overlap
+                any other claim
+    '''
+    dict_tiles = bucket_by_tile(claims, tile_size)
+    if not dict_tiles:
+        return 0, claims['id'].tolist()
+    shape = (int((claims['y'] + claims['h']).max()), 
+             int((claims['x'] + claims['w']).max()))
+    
+    block_claims = shared_memory.SharedMemory(create=True, 
+                                              size=max(claims.nbytes, 1))
+    try:
+        np.ndarray(len(claims), dtype=CLAIM_DTYPE, 
+                   buffer=block_claims.buf)[:] = claims
+        list_tasks = [(block_claims.name, len(claims), 
+                       (row * tile_size, min((row + 1) * tile_size, shape[0]),
+                        col * tile_size, min((col + 1) * tile_size, shape[1])),
+                       idx) 
+                      for (row, col), idx in dict_tiles.items()]
+        with workers.solution_pool(evaluate_tile, processes) as pool:
+            list_results = pool.map(evaluate_tile, list_tasks)
+    finally:
+        block_claims.close()
+        block_claims.unlink()
+    
+    contested = np.zeros(len(claims), dtype=bool)
+    for overlap_tile, idx in list_results:
+        contested[idx] = True
+    overlap = sum(overlap_tile for overlap_tile, idx in list_results)
+    return overlap, claims['id'][~contested].tolist()
 
-# for every claim, cycle over it and start adding claims to the grid
-for claim in list_claims:
-    fabric_matrix = make_claims_with_ids(claim)
+# Engines able to evaluate the claims (see part1 / part2)
+ENGINES = {
+        'grid': evaluate_grid,
+        'diff': evaluate_diff,
+        'sweep': evaluate_sweep,
+        'tiled': evaluate_tiled,
+        }
 
-# for every claim, cycle over it and determine if its claims are claimed by
-#   any other claim
-for claim in list_claims:
-    validate_claims(claim, fabric_matrix)
+def part1(claims, method='diff'):
+    '''
+    Purpose: Determine how many square inches of fabric are within two or 
+        more claims
+
+    Input: 
+        (1) claims (numpy array of CLAIM_DTYPE): Parsed fabric claims
+        (2) method (string): Engine used to evaluate the claims (see ENGINES)
+    
+    Output: 
+        (1) overlap (int): Square inches of fabric claimed by multiple claims
+    '''
+    overlap, list_intact = ENGINES[method](claims)
+    return overlap
+
+def part2(claims, method='index'):
+    '''
+    Purpose: Find the only claim that doesn't overlap with any other claim
+
+    Input: 
+        (1) claims (numpy array of CLAIM_DTYPE): Parsed fabric claims
+        (2) method (string): 'index' to query a ClaimIndex of the claims,
+                or an engine evaluating the whole fabric (see ENGINES)
+    
+    Output: 
+        (1) claim_id (int): ID of the intact claim (or None if every claim 
+                overlaps another)
+    '''
+    if method == 'index':
+        list_intact = ClaimIndex(claims).intact_claims()
+    else:
+        overlap, list_intact = ENGINES[method](claims)
+    return list_intact[0] if list_intact else None
+
+def solve(source, method='diff'):
+    '''
+    Purpose: Solve both parts of the day's challenge (evaluating the claims
+        only once)
+
+    Input: 
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
+        (2) method (string): Engine used to evaluate the claims (see ENGINES)
+    
+    Output: 
+        (1) (tuple): Answers to part 1 and part 2
+    '''
+    overlap, list_intact = ENGINES[method](parse(source))
+    return overlap, list_intact[0] if list_intact else None
+    
+#==============================================================================
+# Working Code
+#==============================================================================
+if __name__ == '__main__':
+    answer1, answer2 = solve(sys.argv[1] if len(sys.argv) > 1 else PATH_INPUT)
+    
+    #--------------------------------------------------------------------------
+    # Day 3, Part 1
+    #--------------------------------------------------------------------------
+    print('Square inches claimed by multiple claims: ' + str(answer1))
+    
+    #--------------------------------------------------------------------------
+    # Day 3, Part 2
+    #--------------------------------------------------------------------------
+    print('Valid claim found: ' + str(answer2))
@@ -62,200 +62,772 @@ Created on Tue Dec  4 06:52:46 2018
 #==============================================================================
 # Package Import
 #==============================================================================
-import datetime # for timestamp management
+import argparse
+import contextlib
+import heapq
+import itertools
 import numpy as np
-import os
-import pandas as pd
+import operator
 import pathlib
-import tqdm
+import sys
+import tempfile
+import time
 
+# Make the shared aoc2018 helpers importable when run as a script (only 
+#   then, so that importing a solver leaves sys.path alone)
+if __name__ == '__main__':
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2018 import ingest
+
+#==============================================================================
+# Reference Variable Declaration
 #==============================================================================
-# Function Definitions / Reference Variable Declaration
+# Default puzzle input (stored alongside this script)
+PATH_INPUT = pathlib.Path(__file__).resolve().parent.joinpath('input.txt')
+
+# Kinds of events in the log, identified by the first letter of the event
+#   text (which always starts 19 characters into the line, right after the
+#   fixed-width "[1518-11-01 00:00] " timestamp)
+SHIFT, ASLEEP, WAKES = 0, 1, 2
+EVENT_KINDS = {ord('G'): SHIFT, ord('f'): ASLEEP, ord('w'): WAKES}
+EVENT_OFFSET = 19
+
+# A log event: its timestamp as a sortable integer (e.g. 1518-11-01 00:05
+#   --> 151811010005), its kind and the guard beginning a shift (-1 for 
+#   other events)
+EVENT_DTYPE = np.dtype([('key', np.int64), ('kind', np.int8), 
+                        ('guard', np.int32)])
+
+# A nap: the guard, the night (e.g. 15181101) and the minutes falling asleep
+#   and waking up (asleep on [start, end))
+NAP_DTYPE = np.dtype([('guard', np.int32), ('date', np.int32), 
+                      ('start', np.int8), ('end', np.int8)])
+
+# Dates of the naps (e.g. 15181101) are all below this, so that an index 
+#   key of guard * DATE_SPAN + date sorts by guard, then date
+DATE_SPAN = 10**8
+
+# Logs too large for memory are sorted on the raw, fixed-width timestamp 
+#   prefix of every line ("[1518-11-01 00:00]"), which sorts chronologically
+#   as plain bytes
+SORT_KEY_WIDTH = 18
+sort_key = operator.itemgetter(slice(0, SORT_KEY_WIDTH))
+
+# Lines sorted in memory before being spilled to a temporary run file, and
+#   lines handed to the sleep tally at a time
+RUN_LINES = 1 << 20
+BATCH_LINES = 1 << 16
+
+# Largest number of run files merged (i.e. open) at once, well under the 
+#   usual limit of open files
+MERGE_FAN_IN = 64
+
+# Events held back (in follow mode) so that events appended slightly out of
+#   order can still be counted in chronological order: at most this many 
+#   events, for at most this many seconds (so the answers catch up while the
+#   log is idle).  Also, seconds waited between checks for new lines.
+REORDER_EVENTS = 256
+REORDER_SECONDS = 5.0
+FOLLOW_INTERVAL = 1.0
+
 #==============================================================================
-def ingest_input(file_input):
+# Function Definitions
+#==============================================================================
+def parse_events(buffer):
+    '''
+    Purpose: Parse every event of a block of log lines at once, straight from
+        the raw bytes (no datetime parsing and no Python object per line)
+
+    Input: 
+        (1) buffer (bytes-like): Complete lines of the guard log, in any 
+                order
+    
+    Output: 
+        (1) events (numpy array of EVENT_DTYPE): The events, in the order 
+                they appear in the buffer
+    '''
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    starts = np.r_[0, np.flatnonzero(data == ord('\n')) + 1]
+    starts = starts[starts + EVENT_OFFSET < len(data)]
+    starts = starts[data[starts] == ord('[')]
+    
+    # every line holds year, month, day, hour and minute, plus the guard's 
+    #   ID when a shift begins
+    letters = data[starts + EVENT_OFFSET]
+    kinds = np.full(len(starts), -1, dtype=np.int8)
+    for letter, kind in EVENT_KINDS.items():
+        kinds[letters == letter] = kind
+    if (kinds < 0).any():
+        raise ValueError('Unknown event in the guard log')
+    numbers = ingest.parse_ints(buffer, signed=False)
+    counts = np.where(kinds == SHIFT, 6, 5)
+    firsts = np.cumsum(counts) - counts
+    if len(numbers) != counts.sum():
+        raise ValueError('Every event must start with a timestamp '
+                         '([YYYY-MM-DD hh:mm])')
+    
+    events = np.zeros(len(starts), dtype=EVENT_DTYPE)
+    for position in range(5):
+        events['key'] = events['key'] * 100 + numbers[firsts + position]
+    events['kind'] = kinds
+    events['guard'] = np.where(kinds == SHIFT, 
+                               numbers[np.minimum(firsts + 5, 
+                                                  len(numbers) - 1)], -1)
+    return events
+
+def find_naps(events, guard=-1):
+    '''
+    Purpose: Pair every "falls asleep" event with the "wakes up" event 
+        following it, and tag the nap with the guard on duty
+
+    Input: 
+        (1) events (numpy array of EVENT_DTYPE): Chronologically sorted 
+                events, starting with a shift or a nap
+        (2) guard (int): Guard on duty before the first event (-1 if none)
+    
+    Output: 
+        (1) naps (numpy array of NAP_DTYPE): The naps, in chronological order
+    '''
+    # carry every shift's guard forward to the events that follow it
+    is_shift = events['kind'] == SHIFT
+    latest = np.maximum.accumulate(
+            np.where(is_shift, np.arange(len(events)), -1))
+    on_duty = np.where(latest >= 0, events['guard'][np.maximum(latest, 0)],
+                       guard)
+    
+    asleep = np.flatnonzero(events['kind'] == ASLEEP)
+    if (len(asleep) and (asleep[-1] + 1 == len(events) 
+                         or (events['kind'][asleep + 1] != WAKES).any())):
+        raise ValueError('Every guard falling asleep must wake up next')
+    naps = np.zeros(len(asleep), dtype=NAP_DTYPE)
+    naps['guard'] = on_duty[asleep]
+    naps['date'] = events['key'][asleep] // 10000
+    naps['start'] = events['key'][asleep] % 100
+    naps['end'] = events['key'][asleep + 1] % 100
+    return naps
+
+def sleep_matrix(naps):
+    '''
+    Purpose: Count how many times every guard was asleep during each minute 
+        of the midnight hour.  Every nap adds +1/-1 at its start/end minute
+        of a difference array and a cumulative sum recovers the counts.
+
+    Input: 
+        (1) naps (numpy array of NAP_DTYPE): Naps of the guards
+    
+    Output: 
+        (1) guards (numpy array): Sorted IDs of the guards who napped
+        (2) minutes (numpy array): Times asleep, indexed [guard, minute]
+    '''
+    guards, rows = np.unique(naps['guard'], return_inverse=True)
+    diff = np.zeros((len(guards), 61), dtype=np.int32)
+    np.add.at(diff, (rows, naps['start']), 1)
+    np.add.at(diff, (rows, naps['end']), -1)
+    return guards, np.cumsum(diff[:, :60], axis=1, dtype=np.int32)
+
+def strategy1(guards, minutes):
+    '''
+    Purpose: Find the guard that has the most minutes asleep and the minute
+        that guard spends asleep the most
+
+    Input: 
+        (1) guards (numpy array): IDs of the guards (see `sleep_matrix`)
+        (2) minutes (numpy array): Times asleep, indexed [guard, minute]
+    
+    Output: 
+        (1) (int): ID of the guard multiplied by the minute chosen (None if
+                no guard ever slept)
+    '''
+    if not len(guards):
+        return None
+    sleepiest = np.argmax(minutes.sum(axis=1))
+    return int(guards[sleepiest]) * int(np.argmax(minutes[sleepiest]))
+
+def strategy2(guards, minutes):
+    '''
+    Purpose: Find the guard that is most frequently asleep on the same minute
+
+    Input: 
+        (1) guards (numpy array): IDs of the guards (see `sleep_matrix`)
+        (2) minutes (numpy array): Times asleep, indexed [guard, minute]
+    
+    Output: 
+        (1) (int): ID of the guard multiplied by the minute chosen (None if
+                no guard ever slept)
+    '''
+    if not len(guards):
+        return None
+    sleepiest, minute = np.unravel_index(np.argmax(minutes), minutes.shape)
+    return int(guards[sleepiest]) * int(minute)
+
+def date_key(date):
+    '''
+    Purpose: Convert a date to the integer form used in the naps
+
+    Input: 
+        (1) date (string, int or date): e.g. '1518-11-01', 15181101 or 
+                datetime.date(1518, 11, 1)
+    
+    Output: 
+        (1) (int): The date as an integer (e.g. 15181101)
+    '''
+    if hasattr(date, 'year'):
+        return date.year * 10000 + date.month * 100 + date.day
+    if isinstance(date, str):
+        return int(date.replace('-', ''))
+    return int(date)
+
+class SleepIndex:
+    '''
+    Time-range index over the naps of the guards, for questions spanning 
+    dates such as "which guards were asleep at 00:17 between two dates".
+    Only the nights a guard actually napped are stored: a (minute) sleep 
+    bitmap for every (guard, night), sorted by guard and then night, is 
+    accumulated into prefix sums, so the sleep of a guard over any range of
+    its nights is the difference of two rows found by binary search.
+    '''
+    def __init__(self, naps):
+        '''
+        Input: 
+            (1) naps (numpy array of NAP_DTYPE): Naps of the guards
+        '''
+        self.guards, rows = np.unique(naps['guard'], return_inverse=True)
+        
+        # one entry per (guard, night) napped, keyed by guard row then date 
+        #   (dates are 8-digit integers, e.g. 15181101)
+        self.keys, nights = np.unique(
+                rows.astype(np.int64) * DATE_SPAN + naps['date'], 
+                return_inverse=True)
+        
+        # (guard and night, minute) bitmap from +1/-1 range adds
+        diff = np.zeros((len(self.keys), 61), dtype=np.int16)
+        np.add.at(diff, (nights, naps['start']), 1)
+        np.add.at(diff, (nights, naps['end']), -1)
+        asleep = np.cumsum(diff[:, :60], axis=1, dtype=np.int16) > 0
+        
+        # prefix sums over the entries: cumulative[n] covers entries [0, n),
+        #   so a range of one guard's nights is the difference of two rows
+        self.cumulative = np.zeros((len(self.keys) + 1, 60), dtype=np.int32)
+        np.cumsum(asleep, axis=0, out=self.cumulative[1:])
+    
+    def _nights(self, date_from, date_to):
+        '''
+        Purpose: Prefix positions bounding, for every guard, the nights from
+            `date_from` to `date_to` (both included, None for no bound)
+        '''
+        first = 0 if date_from is None else date_key(date_from)
+        last = DATE_SPAN - 1 if date_to is None else date_key(date_to)
+        offsets = np.arange(len(self.guards), dtype=np.int64) * DATE_SPAN
+        start = np.searchsorted(self.keys, offsets + first, side='left')
+        stop = np.searchsorted(self.keys, offsets + last, side='right')
+        return start, np.maximum(start, stop)
+    
+    def window(self, date_from=None, date_to=None):
+        '''
+        Purpose: Count how many nights every guard was asleep during each 
+            minute, over a range of nights
+
+        Input: 
+            (1) date_from (string, int or date): First night (None for the
+                    start of the log)
+            (2) date_to (string, int or date): Last night (None for the end
+                    of the log)
+        
+        Output: 
+            (1) minutes (numpy array): Nights asleep, indexed [guard, minute]
+                    (rows follow `self.guards`)
+        '''
+        start, stop = self._nights(date_from, date_to)
+        return self.cumulative[stop] - self.cumulative[start]
+    
+    def asleep_at(self, minute, date_from=None, date_to=None):
+        '''
+        Purpose: Find the guards asleep at a minute of the midnight hour on 
+            at least one night of a range
+
+        Input: 
+            (1) minute (int): Minute of the midnight hour (e.g. 17 for 00:17)
+            (2) date_from (string, int or date): First night (None for the
+                    start of the log)
+            (3) date_to (string, int or date): Last night (None for the end
+                    of the log)
+        
+        Output: 
+            (1) dict_guards (dictionary): Guard ID --> number of nights the 
+                    guard was asleep at that minute
+        '''
+        start, stop = self._nights(date_from, date_to)
+        nights = (self.cumulative[stop, minute] 
+                  - self.cumulative[start, minute])
+        return {int(guard): int(count) 
+                for guard, count in zip(self.guards, nights) if count}
+    
+    def total_sleep(self, date_from=None, date_to=None):
+        '''
+        Purpose: Total the minutes every guard slept over a range of nights
+
+        Input: 
+            (1) date_from (string, int or date): First night (None for the
+                    start of the log)
+            (2) date_to (string, int or date): Last night (None for the end
+                    of the log)
+        
+        Output: 
+            (1) dict_guards (dictionary): Guard ID --> minutes asleep (only
+                    guards who slept)
+        '''
+        totals = self.window(date_from, date_to).sum(axis=1)
+        return {int(guard): int(total) 
+                for guard, total in zip(self.guards, totals) if total}
+
+class SleepTally:
+    '''
+    Running (guard, minute) sleep counts fed with chronologically sorted 
+    batches of events, so that a log never has to be held in memory at 
+    once.  The guard on duty and a nap left open at the end of a batch are 
+    carried over to the next batch.
+    '''
+    def __init__(self):
+        self.guard = -1
+        self.pending = np.zeros(0, dtype=EVENT_DTYPE)
+        self.dict_rows = {}
+        self.guards = np.zeros(0, dtype=np.int32)
+        self.minutes = np.zeros((0, 60), dtype=np.int64)
+    
+    def add_events(self, events):
+        '''
+        Purpose: Count the naps of the next batch of events
+
+        Input: 
+            (1) events (numpy array of EVENT_DTYPE): Events following (in 
+                    time) every event added so far, in chronological order
+        
+        Output: 
+            (1) naps (numpy array of NAP_DTYPE): The naps completed by the 
+                    batch
+        '''
+        events = np.concatenate((self.pending, events))
+        cut = len(events)
+        if cut and events['kind'][-1] == ASLEEP:
+            cut -= 1
+        events, self.pending = events[:cut], events[cut:]
+        naps = find_naps(events, self.guard)
+        shifts = events['guard'][events['kind'] == SHIFT]
+        if len(shifts):
+            self.guard = int(shifts[-1])
+        self.add_naps(naps)
+        return naps
+    
+    def add_naps(self, naps):
+        '''
+        Purpose: Count a batch of naps (in any order)
+
+        Input: 
+            (1) naps (numpy array of NAP_DTYPE): Naps of the guards
+        
+        Output: 
+            (1) NONE
+        '''
+        guards, minutes = sleep_matrix(naps)
+        for guard in guards.tolist():
+            self.dict_rows.setdefault(guard, len(self.dict_rows))
+        if len(self.dict_rows) > len(self.minutes):
+            self.minutes = np.vstack((self.minutes, np.zeros(
+                    (len(self.dict_rows) - len(self.minutes), 60), 
+                    dtype=self.minutes.dtype)))
+            self.guards = np.fromiter(self.dict_rows, dtype=np.int32)
+        rows = [self.dict_rows[guard] for guard in guards.tolist()]
+        self.minutes[rows] += minutes
+    
+    def answers(self):
+        '''
+        Purpose: Answer both strategies from the naps counted so far
+
+        Input: 
+            (1) NONE
+        
+        Output: 
+            (1) (tuple): Answers to part 1 and part 2
+        '''
+        # rows in guard order, so that ties resolve as in `sleep_matrix`
+        order = np.argsort(self.guards)
+        guards, minutes = self.guards[order], self.minutes[order]
+        return strategy1(guards, minutes), strategy2(guards, minutes)
+
+def merge_runs(list_runs, path_merged):
+    '''
+    Purpose: Merge sorted run files into a single sorted run file, deleting
+        the runs merged
+
+    Input: 
+        (1) list_runs (list of paths): Sorted run files, in the order they
+                were read (ties keep that order)
+        (2) path_merged (path): Filepath of the merged run
+    
+    Output: 
+        (1) path_merged (path): Filepath of the merged run
+    '''
+    with contextlib.ExitStack() as stack, open(path_merged, 'wb') as f:
+        list_files = [stack.enter_context(open(path_run, 'rb')) 
+                      for path_run in list_runs]
+        f.writelines(heapq.merge(*list_files, key=sort_key))
+    for path_run in list_runs:
+        path_run.unlink()
+    return path_merged
+
+def external_sort(source, run_lines=RUN_LINES, path_temp=None, 
+                  fan_in=MERGE_FAN_IN):
     '''
-    Purpose: Ingest data given a specific filename or filepath
+    Purpose: Sort the lines of a log that may not fit in memory.  Runs of at
+        most `run_lines` lines are sorted in memory on their raw timestamp 
+        prefix and spilled to files in a temporary directory, which are then
+        merged lazily.  A log fitting in a single run is never spilled, and
+        when there are more than `fan_in` runs, groups of `fan_in` runs are
+        first merged into longer runs (in as many passes as needed) so that
+        no more than `fan_in` files are ever open at once.
 
     Input: 
-        (1) file_input (string): Filename of data for part 1 challenge
+        (1) source (string, bytes, path or file object): The guard log
+        (2) run_lines (int): Maximum number of lines held in memory
+        (3) path_temp (string or path): Folder for the temporary directory
+                (defaults to the system's temporary folder)
+        (4) fan_in (int): Largest number of runs merged at once (at least 2)
     
     Output: 
-        (1) NONE 
+        (1) Generator of the non-blank lines (bytes, each ending with a 
+                newline) in chronological order
+    '''
+    with ingest.open_binary(source) as f, \
+            tempfile.TemporaryDirectory(dir=path_temp) as path_runs, \
+            contextlib.ExitStack() as stack:
+        list_runs = []
+        while True:
+            # the log is exhausted when a read comes up short (counted before
+            #   blank lines are dropped)
+            list_read = list(itertools.islice(f, run_lines))
+            exhausted = len(list_read) < run_lines
+            lines = [line if line.endswith(b'\n') else line + b'\n' 
+                     for line in list_read if line.strip()]
+            lines.sort(key=sort_key)
+            if not list_runs and exhausted:
+                yield from lines
+                return
+            if lines:
+                path_run = pathlib.Path(path_runs, 
+                                        'run' + str(len(list_runs)))
+                path_run.write_bytes(b''.join(lines))
+                list_runs.append(path_run)
+            if exhausted:
+                break
+        
+        # ties keep their order: runs are merged in the order they were read
+        #   (consecutive runs are grouped, so merged runs keep that order)
+        num_merged = 0
+        while len(list_runs) > fan_in:
+            list_merged = []
+            for idx in range(0, len(list_runs), fan_in):
+                list_group = list_runs[idx:idx + fan_in]
+                if len(list_group) == 1:
+                    list_merged.extend(list_group)
+                    continue
+                path_merged = pathlib.Path(path_runs, 
+                                           'merged' + str(num_merged))
+                num_merged += 1
+                list_merged.append(merge_runs(list_group, path_merged))
+            list_runs = list_merged
+        list_files = [stack.enter_context(open(path_run, 'rb')) 
+                      for path_run in list_runs]
+        yield from heapq.merge(*list_files, key=sort_key)
+
+def solve_external(source, run_lines=RUN_LINES, path_temp=None, 
+                   batch_lines=BATCH_LINES):
+    '''
+    Purpose: Solve both parts of the day's challenge with bounded memory: 
+        the log is sorted externally and the sorted lines are streamed, a 
+        batch at a time, into a SleepTally
+
+    Input: 
+        (1) source (string, bytes, path or file object): The guard log
+        (2) run_lines (int): Maximum number of lines sorted in memory
+        (3) path_temp (string or path): Folder for the sorted runs
+        (4) batch_lines (int): Number of sorted lines parsed at a time
+    
+    Output: 
+        (1) (tuple): Answers to part 1 and part 2
+    '''
+    tally = SleepTally()
+    lines = external_sort(source, run_lines, path_temp)
+    while True:
+        batch = list(itertools.islice(lines, batch_lines))
+        if not batch:
+            break
+        tally.add_events(parse_events(b''.join(batch)))
+    if len(tally.pending):
+        raise ValueError('Every guard falling asleep must wake up next')
+    return tally.answers()
+
+class LogFollower:
     '''
-    with open(file_input, 'r') as f:
-        content = f.readlines()
+    Incremental view of a guard log that keeps growing: new bytes are fed 
+    as they arrive and the answers are kept up to date without re-reading 
+    the log.  Events pass through a small reorder buffer (a heap of the 
+    `reorder_events` latest events, none held for more than 
+    `reorder_seconds`) before reaching the SleepTally, so events appended 
+    out of order are still counted chronologically as long as they are 
+    not too late.  Later events can no longer be placed and are only 
+    counted in `num_late`, along with the naps they leave without a 
+    "wakes up" event (which are dropped).
+    '''
+    def __init__(self, reorder_events=REORDER_EVENTS, 
+                 reorder_seconds=REORDER_SECONDS):
+        '''
+        Input: 
+            (1) reorder_events (int): Largest number of events held back
+            (2) reorder_seconds (float): Longest time an event is held back
+        '''
+        self.reorder_events = reorder_events
+        self.reorder_seconds = reorder_seconds
+        self.tally = SleepTally()
+        self.heap = []
+        self.partial = b''
+        self.num_events = 0
+        self.num_late = 0
+        self.key_released = -1
+    
+    def feed(self, data, now=None):
+        '''
+        Purpose: Count the events of newly appended bytes (a line cut short 
+            is kept until the rest of it arrives), and release the events 
+            held back for too long (so feeding no bytes at all still lets 
+            the answers catch up)
+
+        Input: 
+            (1) data (bytes): Bytes appended to the log
+            (2) now (float): Current time.monotonic() (read if None)
+        
+        Output: 
+            (1) naps (numpy array of NAP_DTYPE): Naps completed by the bytes
+        '''
+        now = time.monotonic() if now is None else now
+        data = self.partial + data
+        cut = data.rfind(b'\n') + 1
+        self.partial = data[cut:]
+        for event in parse_events(data[:cut]).tolist():
+            if event[0] < self.key_released:
+                self.num_late += 1
+                continue
+            heapq.heappush(self.heap, 
+                           (event[0], self.num_events, now) + event)
+            self.num_events += 1
         
-    # Strip trailing new line from strings in the list
-    for item in content:
-        content[content.index(item)] = item.strip()
+        # events held back for too long are released along with every event
+        #   preceding them
+        key_expired = max((entry[0] for entry in self.heap 
+                           if now - entry[2] >= self.reorder_seconds), 
+                          default=-1)
+        num_expired = sum(1 for entry in self.heap if entry[0] <= key_expired)
+        return self._release(max(len(self.heap) - self.reorder_events, 
+                                 num_expired))
     
-    return content
+    def flush(self):
+        '''
+        Purpose: Count every event still held back (e.g. once the log is
+            complete)
 
-def function_name(var1, var2, var3):
+        Input: 
+            (1) NONE
+        
+        Output: 
+            (1) naps (numpy array of NAP_DTYPE): Naps completed by the events
+        '''
+        if self.partial.strip():
+            self.partial += b'\n'
+        naps = self.feed(b'')
+        return np.concatenate((naps, self._release(len(self.heap))))
+    
+    def _release(self, num_events):
+        '''
+        Purpose: Hand the oldest `num_events` held back events to the tally
+        '''
+        list_events = [heapq.heappop(self.heap)[3:] 
+                       for _ in range(max(num_events, 0))]
+        if not list_events:
+            return self.tally.add_events(np.zeros(0, dtype=EVENT_DTYPE))
+        self.key_released = list_events[-1][0]
+        
+        # a guard falling asleep must wake up next: when the "wakes up" 
+        #   event came too late (and was dropped), the open nap is dropped
+        #   as well, rather than ending at the wrong time
+        list_kinds = [kind for key, kind, guard in list_events]
+        if len(self.tally.pending) and list_kinds[0] != WAKES:
+            self.tally.pending = self.tally.pending[:0]
+            self.num_late += 1
+        list_kept = [event for event, kind, kind_next 
+                     in zip(list_events, list_kinds, list_kinds[1:] + [WAKES])
+                     if kind != ASLEEP or kind_next == WAKES]
+        self.num_late += len(list_events) - len(list_kept)
+        return self.tally.add_events(np.array(list_kept, dtype=EVENT_DTYPE))
+    
+    def answers(self):
+        '''
+        Purpose: Answer both strategies from the events counted so far
+        '''
+        return self.tally.answers()
+
+def tail(path, interval=FOLLOW_INTERVAL):
     '''
-    Purpose: Stuff goes here
+    Purpose: Follow a file that keeps growing (like `tail -f`), reading 
+        every byte exactly once
 
-    Input:   
-        (1) var1 (type): description
-        (2) var2 (type): description
-        (3) var3 (type): description
+    Input: 
+        (1) path (string or path): Filepath of the file to follow
+        (2) interval (float): Seconds waited when no new bytes are available
     
     Output: 
-        (1) output1 (type): description
+        (1) Generator of the bytes appended to the file (starting with its 
+                current content, read in pieces of ingest.CHUNK_SIZE), and 
+                of an empty bytes object whenever no new bytes were found; 
+                never ending
+    '''
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(ingest.CHUNK_SIZE)
+            yield data
+            if not data:
+                time.sleep(interval)
+
+def follow(path, reorder_events=REORDER_EVENTS, 
+           reorder_seconds=REORDER_SECONDS, interval=FOLLOW_INTERVAL):
+    '''
+    Purpose: Keep answering both strategies as lines are appended to a 
+        guard log
+
+    Input: 
+        (1) path (string or path): Filepath of the guard log
+        (2) reorder_events (int): Number of events held back for reordering
+        (3) reorder_seconds (float): Longest time an event is held back
+        (4) interval (float): Seconds waited between checks for new lines
+    
+    Output: 
+        (1) Generator of the answers to part 1 and part 2 (tuple) after every
+                batch of new lines (and whenever held back events are 
+                released while the log is idle), never ending
+    '''
+    follower = LogFollower(reorder_events, reorder_seconds)
+    for data in tail(path, interval):
+        naps = follower.feed(data)
+        if data or len(naps):
+            yield follower.answers()
+
+def parse(source):
     '''
+    Purpose: Read the guard log, sort it into chronological order and 
+        extract every nap
+
+    Input: 
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
+    
+    Output: 
+        (1) naps (numpy array of NAP_DTYPE): Chronologically sorted naps
+    '''
+    with ingest.map_file(source) as buffer:
+        events = parse_events(buffer)
+    events = events[np.argsort(events['key'], kind='stable')]
+    return find_naps(events)
+
+def part1(naps):
+    '''
+    Purpose: Find the guard that has the most minutes asleep and the minute
+        that guard spends asleep the most
+
+    Input: 
+        (1) naps (numpy array of NAP_DTYPE): Naps of the guards
+    
+    Output: 
+        (1) (int): ID of the guard multiplied by the minute chosen
+    '''
+    return strategy1(*sleep_matrix(naps))
+
+def part2(naps):
+    '''
+    Purpose: Find the guard that is most frequently asleep on the same minute
+
+    Input: 
+        (1) naps (numpy array of NAP_DTYPE): Naps of the guards
+    
+    Output: 
+        (1) (int): ID of the guard multiplied by the minute chosen
+    '''
+    return strategy2(*sleep_matrix(naps))
+
+def solve(source):
+    '''
+    Purpose: Solve both parts of the day's challenge
+
+    Input: 
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
+    
+    Output: 
+        (1) (tuple): Answers to part 1 and part 2
+    '''
+    naps = parse(source)
+    return part1(naps), part2(naps)
+
 #==============================================================================
 # Working Code
 #==============================================================================
-
-# Set the project working directory
-path_project = pathlib.Path('/home/ejreidelbach/Projects/adventOfCode2018')
-os.chdir(path_project)
-
-# Ingest the data
-data_raw = ingest_input(path_project.joinpath('05','input.txt'))
-
-#------------------------------------------------------------------------------
-# Part 1:  Find the guard that has the most minutes asleep.  
-#           - What minute does that guard spend asleep the most?
-#           - What is the ID of that guard multipled by the minute chosen?
-#------------------------------------------------------------------------------
-
-### Step 1:  Sort the data into chronological order
-data_clean = []
-for data in data_raw:
-    time_str = data.split(']')[0].split('[')[1]
-    time_stamp = datetime.datetime.strptime(time_str, '%Y-%m-%d %H:%M')
-    event = data.split('] ')[1]
-    data_clean.append([time_stamp, event])
-
-# convert the data to a DataFrame    
-df = pd.DataFrame(data_clean, columns = ['timestamp', 'event'])
-
-# sort the DataFrame by timestamp and reset the index
-df = df.sort_values('timestamp')
-df = df.reset_index(drop=True)
-
-### Step 2:  Create a column that indicates the guard it's associated with
-###             and whether or not the guard is awake or asleep
-list_events = list(df['event'])
-list_guards = []
-guard = ''
-
-for event in list_events:
-    # Guard status
-    if 'Guard' in event:
-        guard = event.split('Guard #')[1].split(' ')[0]
-    list_guards.append(guard)
-
-    
-df['guard'] = list_guards
-
-### Step 3:  Create a column that calculates how many minutes the guard slept
-list_time = df['timestamp']
-list_time_asleep = []
-time_begin_sleep = ''
-for time, event in zip(list_time, list_events):
-    if 'asleep' in event:
-        time_begin_sleep = time
-        list_time_asleep.append(0)
-    elif 'wakes' in event:
-        list_time_asleep.append((time - time_begin_sleep).total_seconds())
-        time_begin_sleep = ''
-    # covers guard changes
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Day 4: Repose Record')
+    parser.add_argument(
+            'input', nargs='?', default=str(PATH_INPUT),
+            help='guard log to be analyzed')
+    parser.add_argument(
+            '--external', action='store_true',
+            help='sort the log on disk, for logs larger than memory')
+    parser.add_argument(
+            '--run-lines', type=int, default=RUN_LINES,
+            help='lines sorted in memory at a time (with --external)')
+    parser.add_argument(
+            '--temp-dir', default=None,
+            help='folder for the sorted runs (with --external)')
+    parser.add_argument(
+            '--follow', action='store_true',
+            help='keep the answers updated as lines are appended to the log')
+    parser.add_argument(
+            '--reorder', type=int, default=REORDER_EVENTS,
+            help='events held back to reorder late lines (with --follow)')
+    parser.add_argument(
+            '--reorder-seconds', type=float, default=REORDER_SECONDS,
+            help='longest time a line is held back (with --follow)')
+    args = parser.parse_args()
+    
+    if args.follow:
+        try:
+            for answer1, answer2 in follow(args.input, args.reorder, 
+                                             args.reorder_seconds):
+                print('Strategy 1: ' + str(answer1) + '  Strategy 2: ' 
+                      + str(answer2), flush=True)
+        except KeyboardInterrupt:
+            sys.exit(0)
+    elif args.external:
+        answer1, answer2 = solve_external(args.input, args.run_lines, 
+                                          args.temp_dir)
     else:
-        list_time_asleep.append(0)
-        
-df['time_asleep'] = list_time_asleep
-
-### Step 4:  Find the guard with the most minutes asleep
-sleepiest_id = df.groupby(['guard'])['time_asleep'].sum().sort_values(
-        ascending = False).index[0]
-
-### Step 5:  Find the minute the guard slept the most
-df_sleepy = df[df['guard'] == sleepiest_id]
-
-dict_guard = {}
-for a in range(0,60):
-    dict_guard[a] = 0
-start_min = ''
-start_time = ''
-
-for row_idx, row in df_sleepy.iterrows():
-    if 'asleep' in row['event']:
-        start_min = row['timestamp'].minute
-        start_time = row['timestamp']
-    elif 'wakes' in row['event']:
-        stop_time = row['timestamp']
-        time_diff = int((stop_time-start_time).total_seconds()/60)
-        minute = 0
-        while minute < time_diff:
-            sleep_min = (start_min + minute)%60
-            dict_guard[sleep_min] += 1
-            minute += 1
-                
-df_minutes = pd.DataFrame.from_dict(dict_guard, orient='index', columns=['count'])
-sleepy_minute = df_minutes['count'].sort_values(ascending=False).index[0]
-                
-### Step 6:  What is the ID of the guard multiple by the minute chosen?
-print('ID multipled by minute: ' + str(int(sleepiest_id) * sleepy_minute))
-
-#------------------------------------------------------------------------------
-# Part 2:  Find the guard that is most frequenly asleep on the same minute 
-#           - What is the ID of the guard you chose multipled by the minute
-#               they are most commonly asleep
-#------------------------------------------------------------------------------
-# create a dict for storing sleep-by-minute counts for all guards
-dict_guards = {}
-
-# create a unique list of all guard IDs
-set_ids = set(list_guards)
-
-# iterate over all guards
-for guard_id in tqdm.tqdm(set_ids):
-    
-    dict_guard = {}
-    for a in range(0,60):
-        dict_guard[a] = 0
-    start_min = ''
-    start_time = ''
-    
-    # compute the sleep-by-minute count for the guard
-    df_guard = df[df['guard'] == guard_id]
-    for row_idx, row in df_guard.iterrows():
-        
-        if 'asleep' in row['event']:
-            start_min = row['timestamp'].minute
-            start_time = row['timestamp']
-        elif 'wakes' in row['event']:
-            stop_time = row['timestamp']
-            time_diff = int((stop_time-start_time).total_seconds()/60)
-            minute = 0
-            while minute < time_diff:
-                sleep_min = (start_min + minute)%60
-                dict_guard[sleep_min] += 1
-                minute += 1
-                
-    df_minutes = pd.DataFrame.from_dict(dict_guard, orient='index', columns=['count'])
-    sleepy_amount = df_minutes['count'].sort_values(ascending=False).iloc[0]
-    sleepy_minute = df_minutes['count'].sort_values(ascending=False).index[0]
-    
-    dict_guards[guard_id] = {
-            'minute' : sleepy_minute,
-            'number of times slept' : sleepy_amount,
-            }
-
-# sort the dictionary of guards by the guard who slept the most @ the same min.
-sleepiest_guard = ''
-sleepiest_time = 0
-for key, value in dict_guards.items():
-    if dict_guards[key]['number of times slept'] > sleepiest_time:
-        sleepiest_time = dict_guards[key]['number of times slept']
-        sleepiest_guard = key
-
-# Output the results
-print('The sleepiest guard was #: ' + str(sleepiest_guard))
-print('They were asleep on minute ' 
-      + str(dict_guards[sleepiest_guard]['minute']) + ', ' + str(sleepiest_time)
-      + ' times!')
-print('The final answer (guard ID multiplied by the minute chosen) is: ' +
-      str(int(sleepiest_guard)*dict_guards[sleepiest_guard]['minute']))
+        answer1, answer2 = solve(args.input)
+    
+    #--------------------------------------------------------------------------
+    # Part 1:  Find the guard that has the most minutes asleep.  
+    #           - What minute does that guard spend asleep the most?
+    #           - What is the ID of that guard multipled by the minute chosen?
+    #--------------------------------------------------------------------------
+    print('ID multipled by minute: ' + str(answer1))
+    
+    #--------------------------------------------------------------------------
+    # Part 2:  Find the guard that is most frequenly asleep on the same minute 
+    #           - What is the ID of the guard you chose multipled by the 
+    #               minute they are most commonly asleep
+    #--------------------------------------------------------------------------
+    print('The final answer (guard ID multiplied by the minute chosen) is: ' +
+          str(answer2))
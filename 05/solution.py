@@ -66,83 +66,319 @@ Created on Wed Dec  5 07:05:07 2018
 #==============================================================================
 # Package Import
 #==============================================================================
-import os
+import argparse
+import functools
+import itertools
+import multiprocessing
+from multiprocessing import shared_memory
 import pathlib
+import sys
+
+# Make the shared aoc2018 helpers importable when run as a script (only 
+#   then, so that importing a solver leaves sys.path alone)
+if __name__ == '__main__':
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2018 import ingest, workers
 
 #==============================================================================
 # Function Definitions / Reference Variable Declaration
 #==============================================================================
-def ingestInput(file_input):
+# Default puzzle input (stored alongside this script)
+PATH_INPUT = pathlib.Path(__file__).resolve().parent.joinpath('input.txt')
+
+# Unit types (i.e. letters) that can be removed from a polymer
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Largest chunk of a polymer reacted by one worker process (in bytes)
+CHUNK_BYTES = 1 << 24
+
+# Whitespace allowed around the polymer (e.g. the final newline)
+WHITESPACE = b' \t\r\n'
+
+# Marks an empty reaction stack: outside the byte range, so no unit can 
+#   differ from it by 32 alone (0 would react with a space)
+EMPTY = 256
+
+def reducePolymer(polymer, letter=None):
     '''
-    Purpose: Ingest data given a specific filename or filepath
+    Purpose: Fully react a polymer in a single pass.  Units are pushed onto a
+        stack and a unit reacting with the unit on top of the stack (same 
+        type, opposite polarity -- their ASCII codes differ only by the bit
+        worth 32) removes that unit instead, so every unit is pushed and 
+        popped at most once.
 
-    Input: 
-        (1) file_input (string): Filename of data for part 1 challenge
+    Input:   
+        (1) polymer (bytes, bytearray, memoryview or string): The units of 
+                the polymer, e.g. a memoryview of a memory-mapped file 
+                (which is read in place, without copying it)
+        (2) letter (string): Unit type to leave out of the polymer (both 
+                polarities), if any
     
     Output: 
-        (1) The data for the day's challenge (input.txt) in the folder /XX/ 
-                where XX represents the day of the challenge (e.g. 05, 23)
+        (1) stack (bytearray): The fully reacted polymer
     '''
-    with open(file_input, 'r') as f:
-        content = f.readlines()
-        
-    # Strip trailing new line from strings in the list
-    for item in content:
-        content[content.index(item)] = item.strip()
+    if isinstance(polymer, str):
+        polymer = polymer.encode()
+    if letter is not None:
+        removed = frozenset((letter.lower() + letter.upper()).encode())
+        polymer = (unit for unit in polymer if unit not in removed)
+    stack = bytearray()
+    push = stack.append
+    pop = stack.pop
+    # the unit on top of the stack, or EMPTY (which reacts with no byte)
+    top = EMPTY
+    for unit in polymer:
+        if top ^ unit == 32:
+            pop()
+            top = stack[-1] if stack else EMPTY
+        else:
+            push(unit)
+            top = unit
+    return stack
+
+@functools.lru_cache(maxsize=1)
+def reducedPolymer(polymer):
+    '''
+    Purpose: Fully react a polymer, remembering the result for the last 
+        polymer seen so that part 1 and part 2 only react it once
+
+    Input:   
+        (1) polymer (bytes or string): The scanned polymer
     
-    return content
+    Output: 
+        (1) (bytes): The fully reacted polymer
+    '''
+    return bytes(reducePolymer(polymer))
 
 def removeReactions(polymer):
     '''
-    Purpose: Iterate through a polymer (i.e. a string) repeatedly until all
-        possible reactions have been removed.
+    Purpose: Remove all possible reactions from a polymer (see 
+        `reducePolymer`)
 
     Input:   
-        (1) polymer (string): a string composed of upper-case and lower-case
-                letters simulating a polymer. 
+        (1) polymer (bytes or string): a string composed of upper-case and 
+                lower-case letters simulating a polymer. 
     
     Output: 
         (1) length_polymer (int): Remaining length of the polymer (i.e. string)
     '''
-    scan_complete = False   # False implies reactions were in the previous
-                            #   pass of the polymer and more scanning is needed    
-    while scan_complete == False:
-        polymer, scan_complete = triggerReactions(polymer)
+    return len(reducePolymer(polymer))
+
+def polymerBounds(view):
+    '''
+    Purpose: Locate the polymer within a buffer, skipping the whitespace 
+        around it (e.g. the final newline)
+
+    Input:   
+        (1) view (memoryview): The buffer holding the polymer
     
-    print('The length of the polymer after reactions is {len} units'.format(
-            len = len(polymer)))
-    return len(polymer)
+    Output: 
+        (1) start, stop (int): The polymer is view[start:stop]
+    '''
+    start, stop = 0, len(view)
+    while start < stop and view[start] in WHITESPACE:
+        start += 1
+    while stop > start and view[stop - 1] in WHITESPACE:
+        stop -= 1
+    return start, stop
+
+def reduceFile(source):
+    '''
+    Purpose: Fully react the polymer of a (potentially huge) file, reading 
+        it through a memory map rather than loading it into a string
+
+    Input:   
+        (1) source (string or path): Filepath of the polymer, or the text of
+                the polymer itself
     
-def triggerReactions(polymer):
+    Output: 
+        (1) (bytes): The fully reacted polymer
+    '''
+    with ingest.map_file(source) as buffer, memoryview(buffer) as view:
+        start, stop = polymerBounds(view)
+        with view[start:stop] as units:
+            return bytes(reducePolymer(units))
+
+def reduceChunk(task):
     '''
-    Purpose: Iterate through a polymer (i.e a string) and identify any 
-        occurrences of a lower case letter being followed by the capitalized
-        version of the same letter. If this occurs, remove both letters. Do
-        this for every letter in the alphabet.
+    Purpose: Fully react one chunk of a polymer (run in a worker process of
+        `reduceParallel`).  The file is memory-mapped by the worker itself, 
+        so only the chunk's bounds are sent to it.
 
     Input:   
-        (1) polymer (string): a string composed of upper-case and lower-case
-                letters simulating a polymer.     
+        (1) task (tuple): Filepath (or text) of the polymer and the bounds 
+                (start, stop) of the chunk
+    
     Output: 
-        (1) polymer (string): the updated polymer in which
-                reactions have been found and removed over the course of a 
-                single pass through the alphabet
-        (2) scan_complete (boolean): a status indicator which tells us whether
-                or not a reaction was removed from the polymer (True = yes)
+        (1) (bytes): The fully reacted chunk
     '''
-    alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-    scan_complete = True   # assume we won't see any reactions
+    source, start, stop = task
+    with ingest.map_file(source) as buffer, memoryview(buffer) as view:
+        with view[start:stop] as units:
+            return bytes(reducePolymer(units))
+
+def mergeReduced(left, right):
+    '''
+    Purpose: Join two fully reacted polymers.  Neither can react internally,
+        so the only reactions left happen at the boundary: the end of `left`
+        and the start of `right` cancel until two units no longer react.
+
+    Input:   
+        (1) left (bytearray): Fully reacted polymer (extended in place)
+        (2) right (bytes): Fully reacted polymer following `left`
     
-    for letter in alphabet:
-        aA = letter.lower() + letter
-        Aa = letter + letter.lower()
-        if (aA in polymer) or (Aa in polymer):
-            scan_complete = False  # if we do see a reaction, set to False
-        polymer = polymer.replace(aA, '').replace(Aa,'')
+    Output: 
+        (1) left (bytearray): The fully reacted, joined polymer
+    '''
+    position = 0
+    while left and position < len(right) and left[-1] ^ right[position] == 32:
+        left.pop()
+        position += 1
+    with memoryview(right)[position:] as rest:
+        left += rest
+    return left
 
-    return polymer, scan_complete
+def reduceParallel(source, chunk_bytes=CHUNK_BYTES, processes=None):
+    '''
+    Purpose: Fully react a (potentially huge) polymer on every core.  The 
+        memory-mapped polymer is split into chunks that worker processes 
+        react independently; since reacting is associative, the reacted 
+        chunks are then merged pairwise, in a tree, by cancelling units at 
+        their boundaries.
 
-def improvePolymer(polymer):
+    Input:   
+        (1) source (string or path): Filepath of the polymer, or the text of
+                the polymer itself
+        (2) chunk_bytes (int): Largest chunk reacted by one worker
+        (3) processes (int): Number of worker processes (defaults to the 
+                number of CPUs)
+    
+    Output: 
+        (1) (bytes): The fully reacted polymer
+    '''
+    with ingest.map_file(source) as buffer, memoryview(buffer) as view:
+        start, stop = polymerBounds(view)
+    processes = processes or multiprocessing.cpu_count()
+    num_chunks = max(processes, -(-(stop - start) // chunk_bytes))
+    bounds = [start + (stop - start) * idx // num_chunks 
+              for idx in range(num_chunks + 1)]
+    with workers.solution_pool(reduceChunk, processes) as pool:
+        list_reduced = pool.map(reduceChunk, 
+                                [(source, lo, hi) 
+                                 for lo, hi in zip(bounds[:-1], bounds[1:])])
+    
+    list_reduced = [bytearray(reduced) for reduced in list_reduced]
+    while len(list_reduced) > 1:
+        list_reduced = [mergeReduced(*list_reduced[idx:idx + 2]) 
+                        if idx + 1 < len(list_reduced) else list_reduced[idx]
+                        for idx in range(0, len(list_reduced), 2)]
+    return bytes(list_reduced[0]) if list_reduced else b''
+
+def removalLength(task):
+    '''
+    Purpose: Fully react a polymer held in shared memory without one unit 
+        type (run in a worker process of `removalTable`)
+
+    Input:   
+        (1) task (tuple): Name of the shared memory block, length of the 
+                polymer in it and the unit type (letter) to remove
+        
+    Output:
+        (1) (int): Length of the fully reacted polymer
+    '''
+    name, length, letter = task
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        with block.buf[:length] as units:
+            return len(reducePolymer(units, letter))
+    finally:
+        block.close()
+
+def removalTable(reduced, processes=None):
+    '''
+    Purpose: Measure the fully reacted length of the polymer after removing 
+        each unit type.  Removing a unit type after reacting the polymer 
+        leads to the same result as removing it first, so every removal 
+        starts from the (much shorter) reacted polymer, which part 1 has 
+        already produced.  The 26 removals run in a process pool, reading 
+        the reacted polymer from shared memory.
+
+    Input:   
+        (1) reduced (bytes or bytearray): The fully reacted polymer (see 
+                `reducePolymer`)
+        (2) processes (int): Number of worker processes (defaults to the 
+                number of CPUs)
+        
+    Output:
+        (1) dict_lengths (dictionary): Unit type (letter) --> length of the 
+                polymer with that unit type removed
+    '''
+    block = shared_memory.SharedMemory(create=True, size=max(len(reduced), 1))
+    try:
+        block.buf[:len(reduced)] = reduced
+        with workers.solution_pool(removalLength, processes) as pool:
+            list_lengths = pool.map(
+                    removalLength, 
+                    [(block.name, len(reduced), letter) 
+                     for letter in ALPHABET])
+    finally:
+        block.close()
+        block.unlink()
+    return dict(zip(ALPHABET, list_lengths))
+
+def reactAll(source, chunk_size=ingest.CHUNK_SIZE):
+    '''
+    Purpose: Measure, in a single read of the input, the fully reacted 
+        length of the polymer and of all 26 polymers with one unit type 
+        removed.  27 reaction stacks are kept side by side (one per removed 
+        unit type, plus one removing nothing) and every unit read is pushed 
+        onto / reacted with all of them, except the stack leaving its type 
+        out.  This suits polymers on slow storage that would otherwise be 
+        read 26 times.
+
+    Input:   
+        (1) source (string, bytes, path or file object): The polymer
+        (2) chunk_size (int): Number of bytes read at a time
+        
+    Output:
+        (1) length_polymer (int): Length of the fully reacted polymer
+        (2) dict_lengths (dictionary): Unit type (letter) --> length of the 
+                polymer with that unit type removed
+    '''
+    stacks = [bytearray() for _ in range(len(ALPHABET) + 1)]
+    tops = [EMPTY] * len(stacks)    # the unit on top of each stack
+    started = False     # whether the polymer (after any whitespace) began
+    held = b''          # whitespace that may turn out to end the polymer
+    with ingest.open_binary(source) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            # like polymerBounds, only whitespace around the polymer is 
+            #   skipped, so the trailing whitespace of every chunk is held
+            #   back until a unit follows it
+            if not started:
+                chunk = chunk.lstrip(WHITESPACE)
+                started = bool(chunk)
+            body = chunk.rstrip(WHITESPACE)
+            if not body:
+                held += chunk
+                continue
+            for unit in itertools.chain(held, body):
+                lower = unit | 32
+                # only letters can be removed; other units reach every stack
+                skipped = lower - 97 if 97 <= lower <= 122 else -1
+                for idx, stack in enumerate(stacks):
+                    if idx == skipped:
+                        continue
+                    if tops[idx] ^ unit == 32:
+                        stack.pop()
+                        tops[idx] = stack[-1] if stack else EMPTY
+                    else:
+                        stack.append(unit)
+                        tops[idx] = unit
+            held = chunk[len(body):]
+    return len(stacks[-1]), {letter: len(stack) 
+                             for letter, stack in zip(ALPHABET, stacks)}
+
+def improvePolymer(polymer, processes=None):
     '''
     Purpose: Attempt to improve the polymer by determining which unit type 
         (i.e. letter) is causing the most problems by removing all instances of 
@@ -150,55 +386,118 @@ def improvePolymer(polymer):
         measure its length.
         
     Input:   
-        (1) polymer (string): a string composed of upper-case and lower-case
-                letters simulating a polymer. 
+        (1) polymer (bytes or string): a string composed of upper-case and 
+                lower-case letters simulating a polymer. 
+        (2) processes (int): Number of worker processes (see `removalTable`)
         
     Output:
-        (1) NONE
-    '''
-    alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-    length_shortest = len(polymer)
-    letter_shortest = ''
-    
-    for letter in alphabet:
-        # remove the upper- and lower-case versions of the letter
-        polymer_letter_removed = polymer.replace(
-                letter.lower(),'').replace(letter,'')
-        # test the length of the polymer after removing all reactions
-        # if the resulting polymer is the shorest one yet, save it's length
-        length_polymer = removeReactions(polymer_letter_removed)
-        if length_polymer < length_shortest:
-            length_shortest = length_polymer
-            letter_shortest = letter
-    print('The shortest list was {length}, as caused by letter {letter}'
-          .format(length=length_shortest, letter=letter_shortest))
-        
-#==============================================================================
-# Working Code
-#==============================================================================
+        (1) length_shortest (int): Length of the shortest polymer produced
+        (2) letter_shortest (string): Unit type whose removal produced it
+        (3) dict_lengths (dictionary): Length produced by removing each unit
+                type
+    '''
+    dict_lengths = removalTable(reducedPolymer(polymer), processes)
+    letter_shortest = min(ALPHABET, key=dict_lengths.get)
+    return dict_lengths[letter_shortest], letter_shortest, dict_lengths
+
+def parse(source):
+    '''
+    Purpose: Read the polymer
+
+    Input: 
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
+    
+    Output: 
+        (1) polymer (bytes): Today's file is a single long string, so only
+                the first line is needed
+    '''
+    with ingest.open_binary(source) as f:
+        return f.readline().strip()
 
-# Set the project working directory
-path_project = pathlib.Path('/home/ejreidelbach/Projects/adventOfCode2018')
-os.chdir(path_project)
+def part1(polymer):
+    '''
+    Purpose: How many units remain after fully reacting the polymer?
 
-# Set the day of the project
-day = '5'
+    Input: 
+        (1) polymer (bytes): The scanned polymer
+    
+    Output: 
+        (1) (int): Length of the fully reacted polymer
+    '''
+    return len(reducedPolymer(polymer))
 
-# Download and ingest the data for today's challenge
-data_raw = ingestInput(path_project.joinpath(day.zfill(2), 'input.txt'))
+def part2(polymer):
+    '''
+    Purpose: What is the length of the shortest polymer that can be produced
+        by removing all units of exactly one type and fully reacting the 
+        result?
 
-# Today's file is a long string, so let's remove the list element
-data_raw = data_raw[0]
+    Input: 
+        (1) polymer (bytes): The scanned polymer
+    
+    Output: 
+        (1) (int): Length of the shortest polymer
+    '''
+    length_shortest, letter_shortest, dict_lengths = improvePolymer(polymer)
+    return length_shortest
 
-#------------------------------------------------------------------------------
-# Part 1:  How many units remain after fully reacting the polymer you scanned?
-#           - i.e. how many letters are left in the string?
-#------------------------------------------------------------------------------
-len_polymer = removeReactions(data_raw)
+def solve(source):
+    '''
+    Purpose: Solve both parts of the day's challenge
 
-#------------------------------------------------------------------------------
-# Part 2:  Determine which unit type (i.e. letter) is causing the most 
-#           problems by removing all instances of it (regardless of polarity).
-#           Then fully react the reamining polymer and measure its length.
-#------------------------------------------------------------------------------
-improvePolymer(data_raw)
\ No newline at end of file
+    Input: 
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
+    
+    Output: 
+        (1) (tuple): Answers to part 1 and part 2
+    '''
+    polymer = parse(source)
+    return part1(polymer), part2(polymer)
+        
+#==============================================================================
+# Working Code
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Day 5: Alchemical Reduction')
+    parser.add_argument(
+            'input', nargs='?', default=str(PATH_INPUT),
+            help='file holding the polymer')
+    parser.add_argument(
+            '--parallel', action='store_true',
+            help='react memory-mapped chunks of the polymer on every core')
+    parser.add_argument(
+            '--single-pass', action='store_true',
+            help='answer both parts from a single read of the polymer')
+    args = parser.parse_args()
+    
+    # part 2 only needs the reacted polymer (see `removalTable`)
+    if args.single_pass:
+        length_polymer, dict_lengths = reactAll(args.input)
+    else:
+        if args.parallel:
+            polymer = reduceParallel(args.input)
+        else:
+            polymer = reduceFile(args.input)
+        length_polymer = len(polymer)
+        dict_lengths = removalTable(polymer)
+    
+    #--------------------------------------------------------------------------
+    # Part 1:  How many units remain after fully reacting the polymer you 
+    #           scanned?
+    #           - i.e. how many letters are left in the string?
+    #--------------------------------------------------------------------------
+    print('The length of the polymer after reactions is {len} units'.format(
+            len = length_polymer))
+    
+    #--------------------------------------------------------------------------
+    # Part 2:  Determine which unit type (i.e. letter) is causing the most 
+    #           problems by removing all instances of it (regardless of 
+    #           polarity).  Then fully react the reamining polymer and measure
+    #           its length.
+    #--------------------------------------------------------------------------
+    letter_shortest = min(ALPHABET, key=dict_lengths.get)
+    print('The shortest list was {length}, as caused by letter {letter}'
+          .format(length=dict_lengths[letter_shortest], 
+                  letter=letter_shortest))
@@ -47,94 +47,319 @@ Created on Tue Dec 11 08:36:45 2018
     What is the sum of all metadata entries?
     
     ****** PART 2 ******
+    The second check is slightly more complicated: you need to find the value
+    of the root node.
 
+    The value of a node depends on whether it has child nodes:
+        - If a node has no child nodes, its value is the sum of its metadata 
+            entries.
+        - If a node does have child nodes, the metadata entries become 
+            indexes which refer to those child nodes (1 refers to the first 
+            child node, 2 to the second, and so on).  The value of the node 
+            is the sum of the values of the child nodes referenced by the 
+            metadata entries.  Entries referring to a child node that does
+            not exist (including 0) are skipped, and a child node referenced
+            multiple times counts multiple times.
+
+    In the example above, the value of the root node (A) is 66.
+
+    What is the value of the root node?
 """
  
 #==============================================================================
 # Package Import
 #==============================================================================
-import os
-import pandas as pd
+import numpy as np
 import pathlib
+import sys
+
+# Make the shared aoc2018 helpers importable when run as a script (only 
+#   then, so that importing a solver leaves sys.path alone)
+if __name__ == '__main__':
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2018 import ingest
 
 #==============================================================================
 # Function Definitions / Reference Variable Declaration
 #==============================================================================
-def ingestInput(file_input):
+# Default puzzle input (stored alongside this script)
+PATH_INPUT = pathlib.Path(__file__).resolve().parent.joinpath('input.txt')
+
+# Columns of a LicenseTree, stored as the rows of a single array (nodes are
+#   numbered in the order their headers appear in the license file)
+TREE_COLUMNS = ('num_children', 'metadata_offset', 'metadata_length', 
+                'first_child', 'next_sibling', 'parent', 'depth', 
+                'metadata_sum', 'subtree_sum', 'value')
+
+def readTree(data):
     '''
-    Purpose: Ingest data given a specific filename or filepath
+    Purpose: Walk the license file once, with a single cursor and an 
+        explicit stack of the nodes still being read (instead of recursion, 
+        so any depth of tree can be read), adding up the metadata and 
+        valuing every node as soon as its metadata has been read.
 
     Input: 
-        (1) file_input (string): Filename of data for part 1 challenge
+        (1) data (list or numpy array of ints): The numbers of the license 
+                file
     
     Output: 
-        (1) The data for the day's challenge (input.txt) in the folder /XX/ 
-                where XX represents the day of the challenge (e.g. 05, 23)
+        (1) metadata_sum (int): Sum of all metadata entries
+        (2) root_value (int): Value of the root node
+    '''
+    data = data.tolist() if hasattr(data, 'tolist') else list(data)
+    if len(data) < 2:
+        raise ValueError('The license file must hold at least one node')
+    
+    # every entry of the stack is [children left to read, # of metadata 
+    #   entries, values of the children read so far]
+    cursor = 2
+    stack = [[data[0], data[1], []]]
+    metadata_sum = 0
+    while stack:
+        node = stack[-1]
+        if node[0]:
+            if cursor + 2 > len(data):
+                raise ValueError('The license file ends in the middle of a '
+                                 'node')
+            node[0] -= 1
+            stack.append([data[cursor], data[cursor + 1], []])
+            cursor += 2
+            continue
+        
+        # all children are read: the node's metadata follows them
+        stack.pop()
+        list_metadata = data[cursor:cursor + node[1]]
+        if len(list_metadata) < node[1]:
+            raise ValueError('The license file ends in the middle of a node')
+        cursor += node[1]
+        metadata_sum += sum(list_metadata)
+        list_values = node[2]
+        if list_values:
+            value = sum(list_values[entry - 1] for entry in list_metadata
+                        if 1 <= entry <= len(list_values))
+        else:
+            value = sum(list_metadata)
+        if stack:
+            stack[-1][2].append(value)
+    
+    if cursor != len(data):
+        raise ValueError('The license file holds numbers after the root node')
+    return metadata_sum, value
+
+class LicenseTree:
+    '''
+    Columnar form of the license tree, built once and then queried in O(1).
+    Every column of TREE_COLUMNS is a row of one numpy array (e.g. 
+    `tree.parent[node]`), nodes being numbered in the order their headers 
+    appear in the license file, so a node's children and descendants always
+    come after it.  The children of every node are also listed 
+    contiguously, compressed-sparse-row style, in `child_ids` (the children
+    of node n are child_ids[child_offsets[n]:child_offsets[n + 1]]).
     '''
-    with open(file_input, 'r') as f:
-        content = f.readlines()
+    def __init__(self, data):
+        '''
+        Input: 
+            (1) data (list or numpy array of ints): The numbers of the 
+                    license file
+        '''
+        self.data = np.asarray(data, dtype=np.int64)
+        list_data = self.data.tolist()
+        if len(list_data) < 2:
+            raise ValueError('The license file must hold at least one node')
+        
+        # read the headers with a single cursor and an explicit stack of 
+        #   [node, children left to read] (see `readTree`)
+        list_children, list_lengths, list_offsets = [], [], []
+        list_parents, list_depths = [], []
+        cursor = 0
+        stack = []
+        while True:
+            if not stack or stack[-1][1]:
+                if cursor + 2 > len(list_data):
+                    raise ValueError('The license file ends in the middle '
+                                     'of a node')
+                if stack:
+                    stack[-1][1] -= 1
+                list_parents.append(stack[-1][0] if stack else -1)
+                list_depths.append(len(stack))
+                list_children.append(list_data[cursor])
+                list_lengths.append(list_data[cursor + 1])
+                list_offsets.append(0)
+                stack.append([len(list_children) - 1, list_data[cursor]])
+                cursor += 2
+                continue
+            node = stack.pop()[0]
+            list_offsets[node] = cursor
+            cursor += list_lengths[node]
+            if not stack:
+                break
+        if cursor != len(list_data):
+            raise ValueError('The license file ends in the middle of a node '
+                             'or holds numbers after the root node')
         
-    # Strip trailing new line from strings in the list
-    for item in content:
-        content[content.index(item)] = item.strip()
+        num_nodes = len(list_children)
+        self.columns = np.full((len(TREE_COLUMNS), num_nodes), -1, 
+                               dtype=np.int64)
+        for idx, name in enumerate(TREE_COLUMNS):
+            setattr(self, name, self.columns[idx])
+        self.num_children[:] = list_children
+        self.metadata_offset[:] = list_offsets
+        self.metadata_length[:] = list_lengths
+        self.parent[:] = list_parents
+        self.depth[:] = list_depths
+        
+        # children listed per parent, in file order (a stable sort of the 
+        #   nodes by parent keeps the file order among siblings)
+        self.child_offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(self.num_children, out=self.child_offsets[1:])
+        self.child_ids = np.argsort(self.parent[1:], kind='stable') + 1
+        has_children = self.num_children > 0
+        self.first_child[has_children] = self.child_ids[
+                self.child_offsets[:-1][has_children]]
+        siblings = (self.parent[self.child_ids[1:]] 
+                    == self.parent[self.child_ids[:-1]])
+        self.next_sibling[self.child_ids[:-1][siblings]] = \
+            self.child_ids[1:][siblings]
+        
+        cumulative = np.zeros(len(self.data) + 1, dtype=np.int64)
+        np.cumsum(self.data, out=cumulative[1:])
+        self.metadata_sum[:] = (
+                cumulative[self.metadata_offset + self.metadata_length] 
+                - cumulative[self.metadata_offset])
+        self._memoize()
+    
+    def _memoize(self):
+        '''
+        Purpose: Compute the subtree metadata sum and the value of every node
+            in one pass from the last node to the first (every node comes 
+            after its parent, so its children are complete when it is 
+            reached)
+        '''
+        list_data = self.data.tolist()
+        list_offsets = self.metadata_offset.tolist()
+        list_lengths = self.metadata_length.tolist()
+        list_parents = self.parent.tolist()
+        list_child_offsets = self.child_offsets.tolist()
+        list_child_ids = self.child_ids.tolist()
+        list_subtree = self.metadata_sum.tolist()
+        list_values = [0] * len(list_subtree)
+        for node in range(len(list_subtree) - 1, -1, -1):
+            list_metadata = list_data[list_offsets[node]:
+                                      list_offsets[node] + list_lengths[node]]
+            list_kids = list_child_ids[list_child_offsets[node]:
+                                       list_child_offsets[node + 1]]
+            if list_kids:
+                list_values[node] = sum(
+                        list_values[list_kids[entry - 1]] 
+                        for entry in list_metadata 
+                        if 1 <= entry <= len(list_kids))
+            else:
+                list_values[node] = sum(list_metadata)
+            if list_parents[node] >= 0:
+                list_subtree[list_parents[node]] += list_subtree[node]
+        self.subtree_sum[:] = list_subtree
+        self.value[:] = list_values
+    
+    def __len__(self):
+        return self.columns.shape[1]
+    
+    def node_value(self, node=0):
+        '''
+        Purpose: Value of a node (the root by default)
+        '''
+        return int(self.value[node])
+    
+    def subtree_metadata(self, node=0):
+        '''
+        Purpose: Sum of the metadata entries of a node and all its 
+            descendants (the whole tree by default)
+        '''
+        return int(self.subtree_sum[node])
+    
+    def node_depth(self, node):
+        '''
+        Purpose: Number of ancestors of a node (0 for the root)
+        '''
+        return int(self.depth[node])
+    
+    def children(self, node):
+        '''
+        Purpose: Children of a node, in file order (a view into `child_ids`)
+        '''
+        return self.child_ids[self.child_offsets[node]:
+                              self.child_offsets[node + 1]]
+    
+    def metadata(self, node):
+        '''
+        Purpose: Metadata entries of a node (a view into the license file)
+        '''
+        offset = self.metadata_offset[node]
+        return self.data[offset:offset + self.metadata_length[node]]
+
+def parse(source):
+    '''
+    Purpose: Ingest the data for today's challenge
+
+    Input: 
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
+    
+    Output: 
+        (1) data (numpy array): The numbers of the license file
+    '''
+    return ingest.extract_ints(source)
+
+def part1(data):
+    '''
+    Purpose: What is the sum of all metadata entries?
+
+    Input: 
+        (1) data (numpy array): The numbers of the license file
     
-    return content
+    Output: 
+        (1) metadata_sum (int): Sum of all metadata entries
+    '''
+    metadata_sum, root_value = readTree(data)
+    return metadata_sum
 
-def functionName(var1, var2, var3):
+def part2(data):
     '''
-    Purpose: Stuff goes here
+    Purpose: What is the value of the root node?
 
-    Input:   
-        (1) var1 (type): description
-        (2) var2 (type): description
-        (3) var3 (type): description
+    Input: 
+        (1) data (numpy array): The numbers of the license file
     
     Output: 
-        (1) output1 (type): description
+        (1) root_value (int): Value of the root node
     '''
+    metadata_sum, root_value = readTree(data)
+    return root_value
+
+def solve(source):
+    '''
+    Purpose: Solve both parts of the day's challenge
+
+    Input: 
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
+    
+    Output: 
+        (1) (tuple): Answers to part 1 and part 2
+    '''
+    return readTree(parse(source))
+    
 #==============================================================================
 # Working Code
 #==============================================================================
-
-# Set the project working directory
-path_project = pathlib.Path('/home/ejreidelbach/Projects/adventOfCode2018')
-os.chdir(path_project)
-
-# Set the day of the project
-day = '8'
-
-# Download and ingest the data for today's challenge
-data_raw = ingestInput(path_project.joinpath(day.zfill(2), 'input.txt'))
-data_raw = data_raw[0]
-
-#------------------------------------------------------------------------------
-# Part 1.  What is the sum of all metadata entries?
-#------------------------------------------------------------------------------
-def readNode(list_metadata, list_data):   
-    # Extract the # of children and the # of metadata elements
-    num_child_nodes, num_metadata_entries = list_data[:2]
-    list_data = list_data[2:]
-    
-    for num in range(num_child_nodes):
-        readNode(list_metadata, list_data)
-    
-    # Base case
-    # No children exist -- return the metadata values
-    if num_child_nodes == 0:
-        print('In base: # meta_data entries is: ' + str(num_metadata_entries))
-        for entry in range(2,num_metadata_entries+2):
-            print('Metadata: ' + str(list_data[entry]))
-            list_metadata.append(int(list_data[entry]))
-        return list_metadata
-    # Recurseive case
-    # Thread the state through the recursive call
-    else:
-        return readNode(list_metadata, list_data[2:])
-
-test = '2 3 0 3 10 11 12 1 1 0 1 99 2 1 1 2'
-test = test.split(' ')
-test = [int(x) for x in test]
-print(readNode([], test))
-#------------------------------------------------------------------------------
-# Part 2.
-#------------------------------------------------------------------------------
\ No newline at end of file
+if __name__ == '__main__':
+    answer1, answer2 = solve(sys.argv[1] if len(sys.argv) > 1 else PATH_INPUT)
+    
+    #--------------------------------------------------------------------------
+    # Part 1.  What is the sum of all metadata entries?
+    #--------------------------------------------------------------------------
+    print('Part 1: ' + str(answer1))
+    
+    #--------------------------------------------------------------------------
+    # Part 2.  What is the value of the root node?
+    #--------------------------------------------------------------------------
+    print('Part 2: ' + str(answer2))
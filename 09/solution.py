@@ -89,63 +89,86 @@ Created on Tue Dec 11 13:25:08 2018
 #==============================================================================
 # Package Import
 #==============================================================================
-import os
-import pandas as pd
 import pathlib
+import sys
+
+# Make the shared aoc2018 helpers importable when run as a script (only 
+#   then, so that importing a solver leaves sys.path alone)
+if __name__ == '__main__':
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2018 import ingest
 
 #==============================================================================
 # Function Definitions / Reference Variable Declaration
 #==============================================================================
-def ingestInput(file_input):
+# Default puzzle input (stored alongside this script)
+PATH_INPUT = pathlib.Path(__file__).resolve().parent.joinpath('input.txt')
+
+def parse(source):
     '''
-    Purpose: Ingest data given a specific filename or filepath
+    Purpose: Ingest the data for today's challenge
 
     Input: 
-        (1) file_input (string): Filename of data for part 1 challenge
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
     
     Output: 
-        (1) The data for the day's challenge (input.txt) in the folder /XX/ 
-                where XX represents the day of the challenge (e.g. 05, 23)
+        (1) (tuple): Number of players and the points of the last marble
+                (from '<players> players; last marble is worth <points> points')
     '''
-    with open(file_input, 'r') as f:
-        content = f.readlines()
-        
-    # Strip trailing new line from strings in the list
-    for item in content:
-        content[content.index(item)] = item.strip()
-    
-    return content
+    num_players, last_marble = ingest.extract_ints(source)[:2]
+    return int(num_players), int(last_marble)
 
-def functionName(var1, var2, var3):
+def part1(game):
     '''
-    Purpose: Stuff goes here
+    Purpose: What is the winning Elf's score?
 
-    Input:   
-        (1) var1 (type): description
-        (2) var2 (type): description
-        (3) var3 (type): description
+    Input: 
+        (1) game: Today's data (see `parse`)
     
     Output: 
-        (1) output1 (type): description
+        (1) The answer to part 1
     '''
-#==============================================================================
-# Working Code
-#==============================================================================
-
-# Set the project working directory
-path_project = pathlib.Path('/home/ejreidelbach/Projects/adventOfCode2018')
-os.chdir(path_project)
+    raise NotImplementedError('Day 9, part 1 has not been solved yet')
 
-# Set the day of the project
-day = '9'
+def part2(game):
+    '''
+    Purpose: Solve part 2 of today's challenge
 
-# Download and ingest the data for today's challenge
-data_raw = ingestInput(path_project.joinpath(day.zfill(2), 'input.txt'))[0]
+    Input: 
+        (1) game: Today's data (see `parse`)
+    
+    Output: 
+        (1) The answer to part 2
+    '''
+    raise NotImplementedError('Day 9, part 2 has not been solved yet')
 
-#------------------------------------------------------------------------------
-# Part 1.  What is the winning Elf's score?
-#------------------------------------------------------------------------------
+def solve(source):
+    '''
+    Purpose: Solve both parts of the day's challenge
 
-#------------------------------------------------------------------------------
-# Part 2.
-#------------------------------------------------------------------------------
\ No newline at end of file
+    Input: 
+        (1) source (string or path): Filepath of the puzzle input, or the 
+                text of the input itself
+    
+    Output: 
+        (1) (tuple): Answers to part 1 and part 2
+    '''
+    game = parse(source)
+    return part1(game), part2(game)
+    
+#==============================================================================
+# Working Code
+#==============================================================================
+if __name__ == '__main__':
+    answer1, answer2 = solve(sys.argv[1] if len(sys.argv) > 1 else PATH_INPUT)
+    
+    #--------------------------------------------------------------------------
+    # Part 1.  What is the winning Elf's score?
+    #--------------------------------------------------------------------------
+    print('Part 1: ' + str(answer1))
+    
+    #--------------------------------------------------------------------------
+    # Part 2.
+    #--------------------------------------------------------------------------
+    print('Part 2: ' + str(answer2))
@@ -81,64 +81,84 @@ Created on Tue Dec 11 13:26:30 2018
 #==============================================================================
 # Package Import
 #==============================================================================
-import os
-import pandas as pd
 import pathlib
+import sys
+
+# Make the shared aoc2018 helpers importable when run as a script (only 
+#   then, so that importing a solver leaves sys.path alone)
+if __name__ == '__main__':
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2018 import ingest
 
 #==============================================================================
 # Function Definitions / Reference Variable Declaration
 #==============================================================================
-def ingestInput(file_input):
+# Puzzle input (today's input is a single value, not a file)
+PUZZLE_INPUT = '7403'
+
+def parse(source):
     '''
-    Purpose: Ingest data given a specific filename or filepath
+    Purpose: Ingest the data for today's challenge
 
     Input: 
-        (1) file_input (string): Filename of data for part 1 challenge
+        (1) source (string or path): The puzzle input (e.g. PUZZLE_INPUT)
     
     Output: 
-        (1) The data for the day's challenge (input.txt) in the folder /XX/ 
-                where XX represents the day of the challenge (e.g. 05, 23)
+        (1) serial (int): The grid serial number
     '''
-    with open(file_input, 'r') as f:
-        content = f.readlines()
-        
-    # Strip trailing new line from strings in the list
-    for item in content:
-        content[content.index(item)] = item.strip()
-    
-    return content
+    return int(ingest.extract_ints(source)[0])
 
-def functionName(var1, var2, var3):
+def part1(serial):
     '''
-    Purpose: Stuff goes here
+    Purpose: What is the X,Y coordinate of the top-left fuel cell of the 3x3
+    square with the largest total power?
 
-    Input:   
-        (1) var1 (type): description
-        (2) var2 (type): description
-        (3) var3 (type): description
+    Input: 
+        (1) serial: Today's data (see `parse`)
     
     Output: 
-        (1) output1 (type): description
+        (1) The answer to part 1
     '''
-#==============================================================================
-# Working Code
-#==============================================================================
-
-# Set the project working directory
-path_project = pathlib.Path('/home/ejreidelbach/Projects/adventOfCode2018')
-os.chdir(path_project)
+    raise NotImplementedError('Day 11, part 1 has not been solved yet')
 
-# Set the day of the project
-day = '11'
+def part2(serial):
+    '''
+    Purpose: Solve part 2 of today's challenge
 
-# Set my puzzle's input value
-data = '7403'
+    Input: 
+        (1) serial: Today's data (see `parse`)
+    
+    Output: 
+        (1) The answer to part 2
+    '''
+    raise NotImplementedError('Day 11, part 2 has not been solved yet')
 
-#------------------------------------------------------------------------------
-# Part 1.  What is the X,Y coordinate of the top-left fuel cell of the 3x3 
-#           square with the largest total power?
-#------------------------------------------------------------------------------
+def solve(source):
+    '''
+    Purpose: Solve both parts of the day's challenge
 
-#------------------------------------------------------------------------------
-# Part 2.
-#------------------------------------------------------------------------------
\ No newline at end of file
+    Input: 
+        (1) source (string or path): The puzzle input (e.g. PUZZLE_INPUT)
+    
+    Output: 
+        (1) (tuple): Answers to part 1 and part 2
+    '''
+    serial = parse(source)
+    return part1(serial), part2(serial)
+    
+#==============================================================================
+# Working Code
+#==============================================================================
+if __name__ == '__main__':
+    answer1, answer2 = solve(sys.argv[1] if len(sys.argv) > 1 else PUZZLE_INPUT)
+    
+    #--------------------------------------------------------------------------
+    # Part 1.  What is the X,Y coordinate of the top-left fuel cell of the 3x3
+    #           square with the largest total power?
+    #--------------------------------------------------------------------------
+    print('Part 1: ' + str(answer1))
+    
+    #--------------------------------------------------------------------------
+    # Part 2.
+    #--------------------------------------------------------------------------
+    print('Part 2: ' + str(answer2))
@@ -80,44 +80,84 @@ Created on Fri Dec 14 15:10:43 2018
 #==============================================================================
 # Package Import
 #==============================================================================
-import os
-import pandas as pd
 import pathlib
+import sys
+
+# Make the shared aoc2018 helpers importable when run as a script (only 
+#   then, so that importing a solver leaves sys.path alone)
+if __name__ == '__main__':
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2018 import ingest
 
 #==============================================================================
 # Function Definitions / Reference Variable Declaration
 #==============================================================================
-def functionName(var1, var2, var3):
+# Puzzle input (today's input is a single value, not a file)
+PUZZLE_INPUT = '260321'
+
+def parse(source):
     '''
-    Purpose: Stuff goes here
+    Purpose: Ingest the data for today's challenge
 
-    Input:   
-        (1) var1 (type): description
-        (2) var2 (type): description
-        (3) var3 (type): description
+    Input: 
+        (1) source (string or path): The puzzle input (e.g. PUZZLE_INPUT)
     
     Output: 
-        (1) output1 (type): description
+        (1) num_recipes (int): Number of recipes from the puzzle input
     '''
-#==============================================================================
-# Working Code
-#==============================================================================
+    return int(ingest.extract_ints(source)[0])
+
+def part1(num_recipes):
+    '''
+    Purpose: What are the scores of the ten recipes immediately after the
+    number of recipes in your puzzle input?
 
-# Set the project working directory
-path_project = pathlib.Path('/home/ejreidelbach/Projects/adventOfCode2018')
-os.chdir(path_project)
+    Input: 
+        (1) num_recipes: Today's data (see `parse`)
+    
+    Output: 
+        (1) The answer to part 1
+    '''
+    raise NotImplementedError('Day 14, part 1 has not been solved yet')
 
-# Set the day of the project
-day = '14'
+def part2(num_recipes):
+    '''
+    Purpose: Solve part 2 of today's challenge
 
-# Your puzzle input is 260321.
-input = 260321
+    Input: 
+        (1) num_recipes: Today's data (see `parse`)
+    
+    Output: 
+        (1) The answer to part 2
+    '''
+    raise NotImplementedError('Day 14, part 2 has not been solved yet')
 
-#------------------------------------------------------------------------------
-# Part 1.  What are the scores of the ten recipes immediately after the number 
-#           of recipes in your puzzle input?
-#------------------------------------------------------------------------------
+def solve(source):
+    '''
+    Purpose: Solve both parts of the day's challenge
 
-#------------------------------------------------------------------------------
-# Part 2.
-#------------------------------------------------------------------------------
\ No newline at end of file
+    Input: 
+        (1) source (string or path): The puzzle input (e.g. PUZZLE_INPUT)
+    
+    Output: 
+        (1) (tuple): Answers to part 1 and part 2
+    '''
+    num_recipes = parse(source)
+    return part1(num_recipes), part2(num_recipes)
+    
+#==============================================================================
+# Working Code
+#==============================================================================
+if __name__ == '__main__':
+    answer1, answer2 = solve(sys.argv[1] if len(sys.argv) > 1 else PUZZLE_INPUT)
+    
+    #--------------------------------------------------------------------------
+    # Part 1.  What are the scores of the ten recipes immediately after the
+    #           number of recipes in your puzzle input?
+    #--------------------------------------------------------------------------
+    print('Part 1: ' + str(answer1))
+    
+    #--------------------------------------------------------------------------
+    # Part 2.
+    #--------------------------------------------------------------------------
+    print('Part 2: ' + str(answer2))
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Dec 15 10:12:31 2018
+
+@author: ejreidelbach
+
+:DESCRIPTION:
+    - Shared helpers for the daily Advent of Code 2018 solutions
+        * ingest: streaming / memory-mapped input ingestion
+        * runner: run and time the daily solutions (python -m aoc2018 run)
+        * generators: seeded synthetic inputs at arbitrary scale
+        * benchmark: time the solutions across input scales and fit their
+            complexity (python -m aoc2018 bench)
+        * workers: process pools able to run the daily solvers' functions
+"""
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Dec 15 13:40:18 2018
+
+@author: ejreidelbach
+
+:DESCRIPTION:
+    - Command-line entry point for the shared helpers
+    
+    Usage:
+        python -m aoc2018 run 1-14 [--input DIR]
+        python -m aoc2018 bench 1-13 [--scales 1,10,100,1000] [--seed N]
+                                     [--budget SECONDS]
+        python -m aoc2018 generate DAY [--scale N] [--seed N] [--output FILE]
+"""
+ 
+#==============================================================================
+# Package Import
+#==============================================================================
+import argparse
+import pathlib
+import sys
+
+from aoc2018 import benchmark, generators, runner
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def main(argv=None):
+    '''
+    Purpose: Parse the command line and dispatch to the requested command
+
+    Input: 
+        (1) argv (list of strings): Command-line arguments (defaults to 
+                sys.argv[1:])
+    
+    Output: 
+        (1) (int): Exit status
+    '''
+    parser = argparse.ArgumentParser(prog='python -m aoc2018')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+    
+    parser_run = commands.add_parser(
+            'run', help='run and time the solutions for a set of days')
+    parser_run.add_argument(
+            'days', help="days to run, e.g. '1-14' or '1,3,5-8'")
+    parser_run.add_argument(
+            '--input', type=pathlib.Path, default=runner.PATH_PROJECT,
+            help='folder containing NN/input.txt (or input.csv) files')
+    
+    parser_bench = commands.add_parser(
+            'bench', help='benchmark the solutions on generated inputs')
+    parser_bench.add_argument(
+            'days', help="days to benchmark, e.g. '1-13' or '1,3,5-8'")
+    parser_bench.add_argument(
+            '--scales', default=','.join(str(s) for s in benchmark.SCALES),
+            help='input sizes as multiples of the real input, e.g. 1,10,100')
+    parser_bench.add_argument('--seed', type=int, default=2018)
+    parser_bench.add_argument(
+            '--budget', type=float, default=60.0,
+            help='skip larger scales once a stage takes longer (seconds)')
+    
+    parser_generate = commands.add_parser(
+            'generate', help='write a synthetic input for a day')
+    parser_generate.add_argument(
+            'day', type=int, choices=sorted(generators.GENERATORS))
+    parser_generate.add_argument('--scale', type=int, default=1)
+    parser_generate.add_argument('--seed', type=int, default=2018)
+    parser_generate.add_argument(
+            '--output', type=pathlib.Path, 
+            help='file to write (defaults to standard output)')
+    
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        runner.run(runner.parse_days(args.days), path_input=args.input)
+    elif args.command == 'bench':
+        benchmark.run(runner.parse_days(args.days), 
+                      scales=[int(s) for s in args.scales.split(',')],
+                      seed=args.seed, budget=args.budget)
+    elif args.command == 'generate':
+        text = generators.GENERATORS[args.day](args.scale, args.seed)
+        if args.output is None:
+            sys.stdout.write(text)
+        else:
+            args.output.write_text(text)
+    return 0
+
+#==============================================================================
+# Working Code
+#==============================================================================
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Dec 16 09:05:52 2018
+
+@author: ejreidelbach
+
+:DESCRIPTION:
+    - Benchmark the daily solutions on synthetic inputs of increasing size
+    
+    For every day with an input generator, inputs are generated at a range of
+    scales (1x, 10x, 100x and 1000x the real puzzle input by default) and the 
+    parse, part 1 and part 2 stages are timed on each one (see runner).  A 
+    power law (time ~ size ** k) is then fit to each stage, so that a stage 
+    whose exponent k is well above 1 (e.g. quadratic behaviour) stands out.
+    
+    Larger scales of a day are skipped once a single stage takes longer than
+    the time budget, so that a quadratic stage cannot stall the whole run.
+"""
+ 
+#==============================================================================
+# Package Import
+#==============================================================================
+import collections
+import sys
+
+import numpy as np
+
+from aoc2018 import generators, runner
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# Default input sizes, as multiples of the real puzzle input
+SCALES = (1, 10, 100, 1000)
+
+# Stages faster than this (in seconds) are too noisy to fit a curve to
+MIN_FIT_TIME = 1e-3
+
+# Exponents above this are flagged as super-linear
+MAX_LINEAR_EXPONENT = 1.3
+
+# Fit of time ~ size ** exponent for one stage of one day
+#   - exponent is None when fewer than two timings were usable
+StageFit = collections.namedtuple(
+        'StageFit', ['day', 'stage', 'sizes', 'walls', 'exponent'])
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def fit_exponent(sizes, walls):
+    '''
+    Purpose: Fit time = c * size ** k by least squares in log-log space
+
+    Input: 
+        (1) sizes (list of ints): Input sizes (in bytes)
+        (2) walls (list of floats): Wall-clock time at each size (in seconds)
+    
+    Output: 
+        (1) exponent (float): The fitted k, or None if fewer than two of the
+                timings were long enough to be meaningful
+    '''
+    points = [(size, wall) for size, wall in zip(sizes, walls) 
+              if wall >= MIN_FIT_TIME]
+    if len(points) < 2:
+        return None
+    log_sizes = np.log([size for size, wall in points])
+    log_walls = np.log([wall for size, wall in points])
+    exponent, intercept = np.polyfit(log_sizes, log_walls, 1)
+    return float(exponent)
+
+def benchmark_day(day, scales=SCALES, seed=2018, budget=60.0, 
+                  out=sys.stdout):
+    '''
+    Purpose: Time a day's solver on generated inputs of increasing size
+
+    Input: 
+        (1) day (int): Day of the challenge
+        (2) scales (list of ints): Input sizes, as multiples of the real input
+        (3) seed (int): Random seed passed to the generator
+        (4) budget (float): Once a stage takes longer than this (in seconds),
+                larger scales are skipped
+        (5) out (file object): Destination of the progress report
+    
+    Output: 
+        (1) list_fits (list of StageFits): One fit per stage that ran
+    '''
+    module = runner.load_day(day)
+    dict_timings = collections.defaultdict(lambda: ([], []))
+    for scale in sorted(scales):
+        text = generators.GENERATORS[day](scale, seed)
+        list_results = runner.run_day(day, text, module)
+        for stage_result in list_results:
+            out.write('{:>5}x '.format(scale) 
+                      + runner.format_result(stage_result) + '\n')
+            if stage_result.status == 'ok':
+                sizes, walls = dict_timings[stage_result.stage]
+                sizes.append(len(text))
+                walls.append(stage_result.wall)
+        out.flush()
+        if any(stage_result.wall > budget for stage_result in list_results):
+            out.write('       day {} exceeded the {}s budget at {}x; larger '
+                      'scales skipped\n'.format(day, budget, scale))
+            break
+    return [StageFit(day, stage, sizes, walls, fit_exponent(sizes, walls)) 
+            for stage, (sizes, walls) in dict_timings.items()]
+
+def format_fit(stage_fit):
+    '''
+    Purpose: Format a stage's complexity fit as a single report line
+
+    Input: 
+        (1) stage_fit (StageFit): The fit
+    
+    Output: 
+        (1) (string): The report line
+    '''
+    if stage_fit.exponent is None:
+        return '{:>3}  {:<6} too fast to fit'.format(
+                stage_fit.day, stage_fit.stage)
+    flag = ''
+    if stage_fit.exponent > MAX_LINEAR_EXPONENT:
+        flag = '  <-- super-linear'
+    return '{:>3}  {:<6} time ~ size^{:.2f}{}'.format(
+            stage_fit.day, stage_fit.stage, stage_fit.exponent, flag)
+
+def run(list_days, scales=SCALES, seed=2018, budget=60.0, out=sys.stdout):
+    '''
+    Purpose: Benchmark every requested day that has an input generator
+
+    Input: 
+        (1) list_days (list of ints): Days to be benchmarked
+        (2) scales (list of ints): Input sizes, as multiples of the real input
+        (3) seed (int): Random seed passed to the generators
+        (4) budget (float): Per-stage time budget (see `benchmark_day`)
+        (5) out (file object): Destination of the report
+    
+    Output: 
+        (1) list_fits (list of StageFits): Every fit made
+    '''
+    list_fits = []
+    for day in list_days:
+        if day not in generators.GENERATORS:
+            out.write('{:>3}  no input generator\n'.format(day))
+            continue
+        out.write('scale  ' + runner.HEADER + '\n')
+        list_fits.extend(benchmark_day(day, scales, seed, budget, out))
+    out.write('\nComplexity (time ~ input size ^ k):\n')
+    for stage_fit in list_fits:
+        out.write(format_fit(stage_fit) + '\n')
+    return list_fits
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Dec 16 09:05:52 2018
+
+@author: ejreidelbach
+
+:DESCRIPTION:
+    - Seeded generators of synthetic puzzle inputs at arbitrary scale
+    
+    Every generator takes a `scale` (1 produces an input about the size of the
+    real puzzle input, 10 one about ten times bigger, ...) and a `seed`, and 
+    returns the text of a valid input for that day.  The same scale and seed 
+    always produce the same text.  Where the puzzle promises an answer exists
+    (a repeated frequency, a pair of near-identical box IDs, an intact claim) 
+    the generator makes sure that it does.
+"""
+ 
+#==============================================================================
+# Package Import
+#==============================================================================
+import datetime
+import math
+import random
+import string
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# Track pieces of day 13 which may be crossed to form an intersection
+_TRACK_CROSSINGS = {('-', '|'), ('|', '-')}
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def make_day01(scale=1, seed=2018):
+    '''
+    Purpose: Frequency changes (one-column CSV with a 'change' header)
+
+    Input: 
+        (1) scale (int): Size multiplier (1 --> ~1,000 changes)
+        (2) seed (int): Random seed
+    
+    Output: 
+        (1) (string): Text of the input -- like the real input, no frequency
+                repeats during the first pass through the list, but the list
+                ends on a small, odd drift so that one repeats in later passes
+    '''
+    rng = random.Random(seed)
+    count = 1000 * scale
+    drift = rng.randrange(1, 100, 2)
+    # climb through even frequencies...
+    list_changes = [rng.randrange(2, 20, 2) for idx in range(count // 2)]
+    current = sum(list_changes)
+    # ...then fall back through odd ones until the drift is reached
+    list_changes.append(-rng.randrange(1, 20, 2))
+    current += list_changes[-1]
+    while current - 18 > drift:
+        list_changes.append(-rng.randrange(2, 20, 2))
+        current += list_changes[-1]
+    if current != drift:
+        list_changes.append(drift - current)
+    return 'change\n' + '\n'.join('{:+d}'.format(change) 
+                                   for change in list_changes) + '\n'
+
+def make_day02(scale=1, seed=2018):
+    '''
+    Purpose: Box IDs (one-column CSV with an 'ID' header)
+
+    Input: 
+        (1) scale (int): Size multiplier (1 --> 250 IDs)
+        (2) seed (int): Random seed
+    
+    Output: 
+        (1) (string): Text of the input -- exactly one pair of IDs (barring 
+                astronomically unlikely collisions) differs by one character
+    '''
+    rng = random.Random(seed)
+    count = 250 * scale
+    list_ids = [''.join(rng.choice(string.ascii_lowercase) for idx in range(26))
+                for row in range(count - 1)]
+    # plant the pair of "correct" boxes
+    twin = list(rng.choice(list_ids))
+    position = rng.randrange(len(twin))
+    twin[position] = rng.choice(
+            [letter for letter in string.ascii_lowercase 
+             if letter != twin[position]])
+    list_ids.insert(rng.randrange(len(list_ids) + 1), ''.join(twin))
+    return 'ID\n' + '\n'.join(list_ids) + '\n'
+
+def make_day03(scale=1, seed=2018):
+    '''
+    Purpose: Fabric claims ('#id @ x,y: wxh')
+
+    Input: 
+        (1) scale (int): Size multiplier (1 --> 1,300 claims on a sheet of 
+                1,000 x 1,000 inches; the sheet grows with the claim count so
+                the density of claims stays the same)
+        (2) seed (int): Random seed
+    
+    Output: 
+        (1) (string): Text of the input -- one claim is placed on its own, 
+                to the right of all the others, so that an intact claim exists
+    '''
+    rng = random.Random(seed)
+    count = 1300 * scale
+    side = int(1000 * math.sqrt(scale))
+    list_claims = []
+    for claim_id in range(1, count):
+        width, height = rng.randint(10, 29), rng.randint(10, 29)
+        list_claims.append('#{} @ {},{}: {}x{}'.format(
+                claim_id, rng.randrange(side - width), 
+                rng.randrange(side - height), width, height))
+    list_claims.insert(rng.randrange(len(list_claims) + 1), 
+                       '#{} @ {},{}: {}x{}'.format(
+                               count, side + 1, rng.randrange(side - 30), 
+                               rng.randint(10, 29), rng.randint(10, 29)))
+    return '\n'.join(list_claims) + '\n'
+
+def make_day04(scale=1, seed=2018):
+    '''
+    Purpose: Guard shift logs ('[1518-11-01 00:05] falls asleep'), in random
+        order
+
+    Input: 
+        (1) scale (int): Size multiplier (1 --> 330 shifts, roughly 1,000 
+                lines; the number of guards grows with the square root)
+        (2) seed (int): Random seed
+    
+    Output: 
+        (1) (string): Text of the input
+    '''
+    rng = random.Random(seed)
+    num_shifts = 330 * scale
+    list_guards = rng.sample(range(10, 4000), int(20 * math.sqrt(scale)))
+    date = datetime.datetime(1518, 1, 1)
+    list_lines = []
+    for shift in range(num_shifts):
+        date += datetime.timedelta(days=1)
+        # the guard begins shortly before (or just after) midnight
+        start = date + datetime.timedelta(minutes=rng.randint(-15, 5))
+        list_lines.append('[{:%Y-%m-%d %H:%M}] Guard #{} begins shift'.format(
+                start, rng.choice(list_guards)))
+        # 0-3 naps, all within the midnight hour (and after the shift began)
+        first = start.minute + 1 if start.hour == 0 else 0
+        list_minutes = sorted(rng.sample(range(first, 60), 
+                                         2 * rng.randint(0, 3)))
+        for asleep, awake in zip(list_minutes[::2], list_minutes[1::2]):
+            list_lines.append('[{:%Y-%m-%d} 00:{:02d}] falls asleep'.format(
+                    date, asleep))
+            list_lines.append('[{:%Y-%m-%d} 00:{:02d}] wakes up'.format(
+                    date, awake))
+    rng.shuffle(list_lines)
+    return '\n'.join(list_lines) + '\n'
+
+def make_day05(scale=1, seed=2018):
+    '''
+    Purpose: A polymer (a single line of upper- and lower-case letters)
+
+    Input: 
+        (1) scale (int): Size multiplier (1 --> 50,000 units)
+        (2) seed (int): Random seed
+    
+    Output: 
+        (1) (string): Text of the input -- units are emitted so that many of
+                them react in nested cascades, as in the real input
+    '''
+    rng = random.Random(seed)
+    count = 50000 * scale
+    letters = string.ascii_letters
+    list_units = []
+    stack = []
+    for idx in range(count):
+        # close an earlier unit (a future reaction) or open a new one
+        if stack and rng.random() < 0.45:
+            list_units.append(stack.pop().swapcase())
+        else:
+            unit = rng.choice(letters)
+            stack.append(unit)
+            list_units.append(unit)
+    return ''.join(list_units) + '\n'
+
+def make_day08(scale=1, seed=2018):
+    '''
+    Purpose: A license file (space separated numbers describing a tree)
+
+    Input: 
+        (1) scale (int): Size multiplier (1 --> 1,500 nodes)
+        (2) seed (int): Random seed
+    
+    Output: 
+        (1) (string): Text of the input -- every node has 1-11 metadata 
+                entries with values 1-11 (some of which refer to children 
+                that do not exist, as in the real input)
+    '''
+    rng = random.Random(seed)
+    count = 1500 * scale
+    # attach every node to a random earlier node (a random recursive tree)
+    list_children = [[] for idx in range(count)]
+    for node in range(1, count):
+        list_children[rng.randrange(node)].append(node)
+    # serialize depth-first, without recursion -- a node's metadata is 
+    #   written once all of its children have been
+    list_numbers = []
+    stack = [(0, None)]
+    while stack:
+        node, num_metadata = stack.pop()
+        if num_metadata is not None:
+            list_numbers.extend(rng.randint(1, 11) 
+                                for idx in range(num_metadata))
+            continue
+        num_metadata = rng.randint(1, 11)
+        list_numbers.extend((len(list_children[node]), num_metadata))
+        stack.append((node, num_metadata))
+        stack.extend((child, None) for child in reversed(list_children[node]))
+    return ' '.join(str(number) for number in list_numbers) + '\n'
+
+def make_day09(scale=1, seed=2018):
+    '''
+    Purpose: Marble game parameters ('N players; last marble is worth M 
+        points')
+
+    Input: 
+        (1) scale (int): Size multiplier (1 --> last marble worth ~72,000)
+        (2) seed (int): Random seed
+    
+    Output: 
+        (1) (string): Text of the input
+    '''
+    rng = random.Random(seed)
+    return '{} players; last marble is worth {} points\n'.format(
+            rng.randint(9, 500), rng.randint(70000, 75000) * scale)
+
+def make_day10(scale=1, seed=2018):
+    '''
+    Purpose: Star positions and velocities 
+        ('position=< x,  y> velocity=< vx, vy>')
+
+    Input: 
+        (1) scale (int): Size multiplier (1 --> 313 stars)
+        (2) seed (int): Random seed
+    
+    Output: 
+        (1) (string): Text of the input -- all stars line up inside a 
+                10-row band (the "message") after ~10,000 seconds
+    '''
+    rng = random.Random(seed)
+    count = 313 * scale
+    seconds = rng.randint(9000, 11000)
+    width = max(60, count // 5)
+    list_lines = []
+    for idx in range(count):
+        x, y = rng.randrange(width), rng.randrange(10)
+        vx, vy = 0, 0
+        while vx == 0 and vy == 0:
+            vx, vy = rng.randint(-5, 5), rng.randint(-5, 5)
+        list_lines.append('position=<{:>6}, {:>6}> velocity=<{:>2}, {:>2}>'
+                          .format(x - vx * seconds, y - vy * seconds, vx, vy))
+    return '\n'.join(list_lines) + '\n'
+
+def make_day12(scale=1, seed=2018):
+    '''
+    Purpose: Plant pots ('initial state: #..#' followed by the spread rules)
+
+    Input: 
+        (1) scale (int): Size multiplier (1 --> 100 pots)
+        (2) seed (int): Random seed
+    
+    Output: 
+        (1) (string): Text of the input -- all 32 rules are listed and an 
+                empty neighbourhood never grows a plant
+    '''
+    rng = random.Random(seed)
+    state = ''.join(rng.choice('#.') for idx in range(100 * scale))
+    list_lines = ['initial state: ' + state, '']
+    for rule in range(32):
+        pattern = ''.join('#' if rule & (1 << bit) else '.' 
+                          for bit in range(4, -1, -1))
+        result = '.' if rule == 0 else rng.choice('#.')
+        list_lines.append('{} => {}'.format(pattern, result))
+    return '\n'.join(list_lines) + '\n'
+
+def make_day13(scale=1, seed=2018):
+    '''
+    Purpose: A map of mine cart tracks and carts
+
+    Input: 
+        (1) scale (int): Size multiplier (1 --> a 150 x 150 map with ~30 
+                loops of track; the map's area grows with the scale)
+        (2) seed (int): Random seed
+    
+    Output: 
+        (1) (string): Text of the input -- loops only ever cross at right 
+                angles ('+'), and an odd number of carts (at least 3) sits 
+                on straight pieces of track facing along them
+    '''
+    rng = random.Random(seed)
+    side = int(150 * math.sqrt(scale))
+    grid = [[' '] * side for row in range(side)]
+    num_loops = 0
+    for attempt in range(60 * scale):
+        width, height = rng.randint(4, 40), rng.randint(4, 40)
+        left, top = rng.randrange(side - width), rng.randrange(side - height)
+        if _place_loop(grid, left, top, width, height):
+            num_loops += 1
+    # carts go on straight track that is not part of an intersection
+    list_straight = [(row, col) for row in range(side) for col in range(side)
+                     if grid[row][col] in '-|']
+    num_carts = min(len(list_straight), max(3, 2 * num_loops)) 
+    num_carts -= 1 - num_carts % 2
+    for row, col in rng.sample(list_straight, num_carts):
+        if grid[row][col] == '-':
+            grid[row][col] = rng.choice('<>')
+        else:
+            grid[row][col] = rng.choice('^v')
+    return '\n'.join(''.join(row).rstrip() for row in grid) + '\n'
+
+def _place_loop(grid, left, top, width, height):
+    '''
+    Purpose: Draw a rectangular loop of track onto a map unless it would 
+        run along (rather than across) track that is already there,
+        or put a curve on top of it
+
+    Input: 
+        (1) grid (list of lists): The map being drawn, edited in place
+        (2) left (int): Column of the loop's left edge
+        (3) top (int): Row of the loop's top edge
+        (4) width (int): Number of columns spanned by the loop
+        (5) height (int): Number of rows spanned by the loop
+    
+    Output: 
+        (1) (boolean): True if the loop was drawn
+    '''
+    right, bottom = left + width - 1, top + height - 1
+    dict_pieces = {(top, left): '/', (top, right): '\\', 
+                   (bottom, left): '\\', (bottom, right): '/'}
+    for col in range(left + 1, right):
+        dict_pieces[(top, col)] = dict_pieces[(bottom, col)] = '-'
+    for row in range(top + 1, bottom):
+        dict_pieces[(row, left)] = dict_pieces[(row, right)] = '|'
+    # loops may only cross each other at right angles
+    for (row, col), piece in dict_pieces.items():
+        existing = grid[row][col]
+        if existing != ' ' and (existing, piece) not in _TRACK_CROSSINGS:
+            return False
+    for (row, col), piece in dict_pieces.items():
+        grid[row][col] = piece if grid[row][col] == ' ' else '+'
+    return True
+
+# Generator for every day with an input file
+GENERATORS = {
+        1: make_day01,
+        2: make_day02,
+        3: make_day03,
+        4: make_day04,
+        5: make_day05,
+        8: make_day08,
+        9: make_day09,
+        10: make_day10,
+        12: make_day12,
+        13: make_day13,
+        }
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Dec 15 10:12:31 2018
+
+@author: ejreidelbach
+
+:DESCRIPTION:
+    - Shared input ingestion for every day's challenge
+    
+    Each day used to carry its own copy of `ingestInput` which read the whole
+    file with `readlines()` and then rewrote every entry through 
+    `content[content.index(item)]` (quadratic, and wrong whenever a line 
+    appears more than once).  The functions below replace those copies:
+        * iter_lines / read_lines:  lazy (or listed) lines with the trailing
+            newline removed -- leading whitespace is preserved (day 13)
+        * map_file:  read-only, memory-mapped access to the whole file
+        * iter_ints / extract_ints:  bulk integer extraction into numpy 
+            arrays, parsed byte-wise (vectorized) in fixed-size chunks so 
+            peak memory is bounded
+"""
+ 
+#==============================================================================
+# Package Import
+#==============================================================================
+import contextlib
+import io
+import mmap
+import os
+
+import numpy as np
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# Default number of bytes read per chunk when streaming a file
+CHUNK_SIZE = 1 << 20
+
+# Powers of ten for every digit position of an int64
+_POWERS_OF_TEN = 10 ** np.arange(19, dtype=np.int64)
+
+# Strings longer than this are never treated as a filename
+_MAX_PATH_LENGTH = 4096
+
+# Bytes that may belong to an integer token which straddles a chunk boundary
+_INT_BYTES = frozenset(b'0123456789-+')
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def is_path(source):
+    '''
+    Purpose: Determine whether an input refers to a file on disk or is the
+        literal text of the input itself
+
+    Input: 
+        (1) source (string, bytes or path): Input to be examined
+    
+    Output: 
+        (1) (boolean): True if `source` is a path object, or a single-line 
+                string naming an existing file; False otherwise
+    '''
+    if isinstance(source, os.PathLike):
+        return True
+    if (isinstance(source, str) and '\n' not in source 
+        and len(source) < _MAX_PATH_LENGTH):
+        return os.path.isfile(source)
+    return False
+
+@contextlib.contextmanager
+def open_binary(source):
+    '''
+    Purpose: Open a day's input for binary reading
+
+    Input: 
+        (1) source (string, bytes, path or file object): Filename / filepath
+                of the data, the literal text of the data, or an already 
+                open file object (e.g. sys.stdin)
+    
+    Output: 
+        (1) A binary file object (files opened here are closed on exit)
+    '''
+    if hasattr(source, 'read'):
+        # text-mode streams (e.g. sys.stdin) expose their bytes via .buffer
+        yield getattr(source, 'buffer', source)
+    elif is_path(source):
+        with open(source, 'rb') as f:
+            yield f
+    elif isinstance(source, str):
+        yield io.BytesIO(source.encode())
+    else:
+        yield io.BytesIO(source)
+
+def iter_lines(source, skip=0):
+    '''
+    Purpose: Lazily iterate over the lines of a day's input
+
+    Input: 
+        (1) source (string, bytes, path or file object): Input to be read
+        (2) skip (int): Number of leading lines to discard (e.g. CSV header)
+    
+    Output: 
+        (1) Generator of strings with the trailing newline removed
+    '''
+    with open_binary(source) as f:
+        for idx, line in enumerate(f):
+            if idx < skip:
+                continue
+            yield line.rstrip(b'\r\n').decode()
+
+def read_lines(source, skip=0):
+    '''
+    Purpose: Read every line of a day's input into a list
+
+    Input: 
+        (1) source (string, bytes, path or file object): Input to be read
+        (2) skip (int): Number of leading lines to discard (e.g. CSV header)
+    
+    Output: 
+        (1) content (list): Strings with the trailing newline removed
+    '''
+    return list(iter_lines(source, skip))
+
+@contextlib.contextmanager
+def map_file(source):
+    '''
+    Purpose: Provide read-only, memory-mapped access to an entire file so 
+        large inputs can be scanned without copying them into memory
+
+    Input: 
+        (1) source (string, bytes or path): Filename / filepath of the data,
+                or the literal text of the data (which is used as-is)
+    
+    Output: 
+        (1) A read-only buffer (mmap, or bytes for literal text and empty 
+                files) that supports slicing, memoryview() and np.frombuffer()
+    '''
+    if not is_path(source):
+        yield source.encode() if isinstance(source, str) else bytes(source)
+        return
+    with open(source, 'rb') as f:
+        # mmap refuses to map empty files
+        if f.seek(0, 2) == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def parse_ints(buffer, signed=True):
+    '''
+    Purpose: Parse every run of digits in a block of bytes at once, without 
+        splitting the block into Python objects first
+
+    Input: 
+        (1) buffer (bytes-like): The bytes to be scanned
+        (2) signed (boolean): True if a '-' directly in front of a number 
+                makes it negative
+    
+    Output: 
+        (1) values (numpy array of int64): The integers, in order
+    '''
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    digits = data - np.uint8(ord('0'))     # non-digits wrap around past 9
+    is_digit = digits < 10
+    edges = np.flatnonzero(np.diff(is_digit, prepend=False, append=False))
+    starts, ends = edges[::2], edges[1::2]
+    if len(starts) == 0:
+        return np.zeros(0, dtype=np.int64)
+    lengths = ends - starts
+    if lengths.max() > len(_POWERS_OF_TEN) - 1:
+        raise ValueError('Integer with more than 18 digits found')
+    
+    # weight every digit by its place value and add up each number's digits
+    positions = np.flatnonzero(is_digit)
+    places = np.repeat(ends, lengths) - positions - 1
+    weighted = digits[positions].astype(np.int64) * _POWERS_OF_TEN[places]
+    offsets = np.zeros(len(starts), dtype=np.intp)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+    values = np.add.reduceat(weighted, offsets)
+    
+    if signed:
+        negative = np.zeros(len(starts), dtype=bool)
+        negative[starts > 0] = data[starts[starts > 0] - 1] == ord('-')
+        values[negative] *= -1
+    return values
+
+def iter_ints(source, signed=True, dtype=np.int64, chunk_size=CHUNK_SIZE):
+    '''
+    Purpose: Stream every integer contained in a day's input, one array per
+        chunk of the file, so that memory use is bounded by `chunk_size`
+
+    Input: 
+        (1) source (string, bytes, path or file object): Input to be read
+        (2) signed (boolean): True if a leading '-' is part of the number;
+                use False for inputs such as dates ('1518-11-01')
+        (3) dtype (numpy dtype): Type of the integer arrays produced
+        (4) chunk_size (int): Number of bytes read per chunk
+    
+    Output: 
+        (1) Generator of 1-D numpy arrays of integers (in file order)
+    '''
+    with open_binary(source) as f:
+        tail = b''
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+            buffer = tail + block
+            # hold back a number that may continue into the next chunk
+            cut = len(buffer)
+            while cut and buffer[cut - 1] in _INT_BYTES:
+                cut -= 1
+            tail = buffer[cut:]
+            values = parse_ints(memoryview(buffer)[:cut], signed)
+            if len(values):
+                yield values.astype(dtype, copy=False)
+        values = parse_ints(tail, signed)
+        if len(values):
+            yield values.astype(dtype, copy=False)
+
+def extract_ints(source, signed=True, dtype=np.int64, chunk_size=CHUNK_SIZE):
+    '''
+    Purpose: Extract every integer contained in a day's input into one array
+
+    Input: 
+        (1) source (string, bytes, path or file object): Input to be read
+        (2) signed (boolean): True if a leading '-' is part of the number
+        (3) dtype (numpy dtype): Type of the integer array produced
+        (4) chunk_size (int): Number of bytes read per chunk
+    
+    Output: 
+        (1) values (numpy array): 1-D array of the integers in file order
+    '''
+    chunks = list(iter_ints(source, signed, dtype, chunk_size))
+    if not chunks:
+        return np.zeros(0, dtype=dtype)
+    return np.concatenate(chunks)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Dec 15 13:40:18 2018
+
+@author: ejreidelbach
+
+:DESCRIPTION:
+    - Run the daily solutions from a single process and time every stage
+    
+    Each day's solver (NN/solution.py) is located and imported, its input is
+    read from disk exactly once, and the parse, part 1 and part 2 stages are
+    run separately.  For every stage the wall-clock time, the CPU time 
+    (including any worker processes the stage used) and the peak resident 
+    set size reached so far are recorded.  The operating system only keeps a
+    high-water mark of the memory used since a process started, so the 
+    peak can only grow from one stage to the next: it is reported as the 
+    largest peak of this process or of any worker process so far.
+"""
+ 
+#==============================================================================
+# Package Import
+#==============================================================================
+import collections
+import os
+import pathlib
+import sys
+import time
+
+try:
+    import resource
+except ImportError:     # not available on Windows
+    resource = None
+
+from aoc2018 import workers
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# Root of the repository (one folder per day lives underneath it)
+PATH_PROJECT = pathlib.Path(__file__).resolve().parents[1]
+
+# Input filenames searched for (in order) inside each day's folder
+INPUT_NAMES = ('input.txt', 'input.csv')
+
+# Stages run for every day, in order
+STAGES = ('parse', 'part1', 'part2')
+
+# Column headings of the report (see `format_result`)
+HEADER = 'day  stage    wall (s)    cpu (s)  peak so far (MB)  answer'
+
+# Measurements taken for a single stage of a single day
+#   - status is one of 'ok', 'not implemented' or 'error'
+#   - result holds the stage's return value (or the error message)
+StageResult = collections.namedtuple(
+        'StageResult', ['day', 'stage', 'status', 'wall', 'cpu', 'peak_rss',
+                        'result'])
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def parse_days(text):
+    '''
+    Purpose: Expand a day specification such as '1-5,8,10-14' into a list
+
+    Input: 
+        (1) text (string): Comma separated days and inclusive day ranges
+    
+    Output: 
+        (1) list_days (list of ints): Sorted, de-duplicated days
+    '''
+    set_days = set()
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = part.split('-', 1)
+            set_days.update(range(int(first), int(last) + 1))
+        else:
+            set_days.add(int(part))
+    return sorted(set_days)
+
+def load_day(day, path_project=PATH_PROJECT):
+    '''
+    Purpose: Import a day's solver module from NN/solution.py
+
+    Input: 
+        (1) day (int): Day of the challenge (e.g. 5)
+        (2) path_project (path): Root folder containing the NN/ folders
+    
+    Output: 
+        (1) module (module): The imported solver, or None if the day has 
+                no solution.py
+    '''
+    path_solution = pathlib.Path(path_project, str(day).zfill(2), 
+                                 'solution.py')
+    if not path_solution.is_file():
+        return None
+    # always load afresh (e.g. from another project folder); the module is
+    #   registered under its name so that worker pools can find it (see 
+    #   workers.solution_pool)
+    name = 'day' + str(day).zfill(2)
+    sys.modules.pop(name, None)
+    return workers.import_path(name, path_solution)
+
+def find_input(day, module, path_input=PATH_PROJECT):
+    '''
+    Purpose: Read a day's input from disk (exactly once)
+
+    Input: 
+        (1) day (int): Day of the challenge (e.g. 5)
+        (2) module (module): The day's solver module -- used as a fallback
+                for days whose input is a single value (PUZZLE_INPUT)
+        (3) path_input (path): Root folder containing NN/input.* files
+    
+    Output: 
+        (1) text (string): The input, or None if no input could be found
+    '''
+    path_day = pathlib.Path(path_input, str(day).zfill(2))
+    for name in INPUT_NAMES:
+        if path_day.joinpath(name).is_file():
+            return path_day.joinpath(name).read_text()
+    return getattr(module, 'PUZZLE_INPUT', None)
+
+def cpu_time():
+    '''
+    Purpose: Report the CPU time used so far by the current process and by 
+        the worker processes it has finished waiting for (e.g. those of a 
+        closed process pool)
+
+    Input: 
+        (1) NONE
+    
+    Output: 
+        (1) (float): User and system CPU time in seconds
+    '''
+    # process_time is finer grained than os.times for the process itself
+    times = os.times()
+    return time.process_time() + times.children_user + times.children_system
+
+def peak_rss():
+    '''
+    Purpose: Report the largest peak resident set size reached so far by the 
+        current process or by any of its finished worker processes (a 
+        high-water mark, which never goes down)
+
+    Input: 
+        (1) NONE
+    
+    Output: 
+        (1) (float): Peak RSS in megabytes, or None if it is unavailable
+    '''
+    if resource is None:
+        return None
+    usage = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return usage / 2**20
+    return usage / 2**10
+
+def measure(day, stage, func, *args):
+    '''
+    Purpose: Run one stage of a day's solver and time it
+
+    Input: 
+        (1) day (int): Day of the challenge
+        (2) stage (string): Name of the stage (e.g. 'part1')
+        (3) func (function): The stage to be run
+        (4) args: Arguments passed through to `func`
+    
+    Output: 
+        (1) (StageResult): Timings, status and return value of the stage
+    '''
+    wall_start = time.perf_counter()
+    cpu_start = cpu_time()
+    try:
+        result = func(*args)
+        status = 'ok'
+    except NotImplementedError as error:
+        result = str(error)
+        status = 'not implemented'
+    except Exception as error:
+        result = '{}: {}'.format(type(error).__name__, error)
+        status = 'error'
+    return StageResult(day, stage, status, time.perf_counter() - wall_start,
+                       cpu_time() - cpu_start, peak_rss(), result)
+
+def run_day(day, text, module):
+    '''
+    Purpose: Run the parse, part 1 and part 2 stages of a day's solver
+
+    Input: 
+        (1) day (int): Day of the challenge
+        (2) text (string): The day's input (see `find_input`)
+        (3) module (module): The day's solver module
+    
+    Output: 
+        (1) list_results (list of StageResults): One entry per stage run -- 
+                the parts are skipped if parsing fails
+    '''
+    parsed = measure(day, 'parse', module.parse, text)
+    list_results = [parsed]
+    if parsed.status != 'ok':
+        return list_results
+    for stage in STAGES[1:]:
+        list_results.append(
+                measure(day, stage, getattr(module, stage), parsed.result))
+    return list_results
+
+def format_result(stage_result):
+    '''
+    Purpose: Format a stage's measurements as a single report line
+
+    Input: 
+        (1) stage_result (StageResult): Measurements of a stage
+    
+    Output: 
+        (1) (string): The report line
+    '''
+    if stage_result.peak_rss is None:
+        rss = '{:>16}'.format('n/a')
+    else:
+        rss = '{:>16.1f}'.format(stage_result.peak_rss)
+    if stage_result.stage == 'parse' and stage_result.status == 'ok':
+        outcome = ''
+    elif stage_result.status == 'ok':
+        outcome = str(stage_result.result)
+    elif stage_result.status == 'not implemented':
+        outcome = '[not implemented]'
+    else:
+        outcome = '[{}] {}'.format(stage_result.status, stage_result.result)
+    return '{:>3}  {:<6} {:>10.4f} {:>10.4f} {}  {}'.format(
+            stage_result.day, stage_result.stage, stage_result.wall, 
+            stage_result.cpu, rss, outcome)
+
+def run(list_days, path_input=PATH_PROJECT, path_project=PATH_PROJECT, 
+        out=sys.stdout):
+    '''
+    Purpose: Run and time every requested day, writing a report as it goes
+
+    Input: 
+        (1) list_days (list of ints): Days to be run
+        (2) path_input (path): Root folder containing NN/input.* files
+        (3) path_project (path): Root folder containing NN/solution.py files
+        (4) out (file object): Destination of the report
+    
+    Output: 
+        (1) list_results (list of StageResults): Every measurement taken
+    '''
+    out.write(HEADER + '\n')
+    list_results = []
+    for day in list_days:
+        module = load_day(day, path_project)
+        if module is None:
+            out.write('{:>3}  no solution found\n'.format(day))
+            continue
+        text = find_input(day, module, path_input)
+        if text is None:
+            out.write('{:>3}  no input found\n'.format(day))
+            continue
+        for stage_result in run_day(day, text, module):
+            out.write(format_result(stage_result) + '\n')
+            out.flush()
+            list_results.append(stage_result)
+    return list_results
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Dec 16 09:05:12 2018
+
+@author: ejreidelbach
+
+:DESCRIPTION:
+    - Process pools for the daily solutions
+
+    The daily solvers live in NN/solution.py files, which can't be imported
+    by name (e.g. `import 05.solution`), so the runner loads them from their
+    path under a made-up name (e.g. 'day05').  Worker processes started with
+    the 'spawn' method (the default on macOS and Windows) only know modules
+    they can import, so every pool created here first loads the solver
+    module, from its path and under the same name, in each worker.
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import importlib.util
+import multiprocessing
+import sys
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def import_path(name, path):
+    '''
+    Purpose: Import a module from its filepath under a given name (once per
+        process) and register it like any imported module
+
+    Input:
+        (1) name (string): Name of the module (e.g. 'day05')
+        (2) path (string or path): Filepath of the module's source
+
+    Output:
+        (1) module (module): The imported module
+    '''
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+def solution_pool(function, processes=None):
+    '''
+    Purpose: Create a process pool able to run a solver's function, however
+        the solver was imported and whatever the start method
+
+    Input:
+        (1) function (function): Module-level function of the solver that
+                the pool will run
+        (2) processes (int): Number of worker processes (defaults to the
+                number of CPUs)
+
+    Output:
+        (1) pool (multiprocessing.Pool): The pool (use it as a context
+                manager)
+    '''
+    module = sys.modules[function.__module__]
+    # scripts run directly are re-run by multiprocessing itself
+    if function.__module__ == '__main__' or not getattr(module, '__file__',
+                                                         None):
+        return multiprocessing.Pool(processes)
+    return multiprocessing.Pool(processes, initializer=import_path,
+                                initargs=(module.__name__, module.__file__))
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Dec 16 11:02:37 2018
+
+@author: ejreidelbach
+
+:DESCRIPTION:
+    - Checks of the day 4 log follower (run with `python -m pytest tests`)
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+from aoc2018 import runner
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+day04 = runner.load_day(4)
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def test_follower_late_wake():
+    '''
+    Purpose: A "wakes up" event arriving after the reorder window drops its
+        nap instead of stopping the follower
+    '''
+    follower = day04.LogFollower(reorder_events=2, reorder_seconds=1e9)
+    for line in (b'[1518-11-01 00:00] Guard #10 begins shift\n',
+                 b'[1518-11-01 00:05] falls asleep\n',
+                 b'[1518-11-02 00:00] Guard #99 begins shift\n',
+                 b'[1518-11-02 00:40] falls asleep\n',
+                 b'[1518-11-02 00:50] wakes up\n',
+                 b'[1518-11-01 00:25] wakes up\n'):
+        follower.feed(line, now=0.0)
+    follower.flush()
+
+    # only guard #99's nap (minutes 40 to 49) is counted
+    assert follower.answers() == (99 * 40, 99 * 40)
+    assert follower.num_late == 2